@@ -1,16 +1,87 @@
 """Base agent class with LLM initialization and model selection."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional, Type
 
+import httpx
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from src.config.settings import get_settings
-from src.config.constants import AGENT_MODELS
+from src.config.constants import (
+    AGENT_MODELS,
+    LLM_CACHE_MAX_SIZE,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE,
+    LLM_HTTP_TIMEOUT_SECONDS,
+)
 from src.models.state import AgentState
 
 
+# Process-wide LLM response cache - identical prompts (e.g. repeat clarification
+# requests or critic re-validation of an unchanged plan) skip the API round-trip
+set_llm_cache(InMemoryCache(maxsize=LLM_CACHE_MAX_SIZE))
+
+
+@lru_cache(maxsize=1)
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all OpenAI requests.
+
+    One pooled client keeps connections (and their TLS sessions) alive
+    across agents instead of each ChatOpenAI opening its own.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+        ),
+    )
+
+
+async def close_http_async_client() -> None:
+    """Close the shared OpenAI HTTP client, if one was created.
+
+    The client is bound to the event loop it was first used on. The cached
+    ChatOpenAI clients hold on to it, so they are dropped too and agents
+    created afterwards start from a fresh client. Should be called when the
+    application exits.
+    """
+    if _get_http_async_client.cache_info().currsize:
+        client = _get_http_async_client()
+        _build_llm.cache_clear()
+        _get_http_async_client.cache_clear()
+        await client.aclose()
+
+
+@lru_cache(maxsize=8)
+def _build_llm(
+    model_name: str,
+    temperature: float,
+    api_key: str,
+    prompt_cache_key: str,
+) -> ChatOpenAI:
+    """Build (or reuse) a ChatOpenAI client for the given configuration.
+
+    Agents with the same model and temperature share one client, and all
+    clients share the pooled HTTP client. The request timeout is set here,
+    since the OpenAI SDK applies its own timeout to every request and
+    overrides the one configured on the HTTP client.
+    """
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=api_key,
+        timeout=LLM_HTTP_TIMEOUT_SECONDS,
+        http_async_client=_get_http_async_client(),
+        # Route requests sharing this agent's static system prompt to the
+        # same backend so OpenAI's automatic prefix caching can hit
+        extra_body={"prompt_cache_key": prompt_cache_key},
+    )
+
+
 class BaseAgent(ABC):
     """Abstract base class for all agents.
 
@@ -21,6 +92,10 @@ class BaseAgent(ABC):
     # Subclasses should set this to their agent name (e.g., "planner", "critic")
     agent_name: str = "base"
 
+    # Structured output schemas used by the agent; their tool/JSON schemas are
+    # converted once when the agent is created instead of on the first run
+    output_schemas: tuple[Type[BaseModel], ...] = ()
+
     def __init__(
         self,
         llm: Optional[ChatOpenAI] = None,
@@ -34,12 +109,17 @@ class BaseAgent(ABC):
             temperature: Optional temperature override.
         """
         self.settings = get_settings()
+        # Structured-output runnables, built lazily once per schema
+        self._structured_llms: dict[Type[BaseModel], ChatOpenAI] = {}
 
         if llm is not None:
             self.llm = llm
         else:
             self.llm = self._create_llm(temperature)
 
+        for output_schema in self.output_schemas:
+            self.get_structured_llm(output_schema)
+
     def _create_llm(self, temperature: Optional[float] = None) -> ChatOpenAI:
         """Create LLM instance based on agent configuration.
 
@@ -54,10 +134,11 @@ class BaseAgent(ABC):
         else:
             model_name = self.settings.gpt4o_mini_model
 
-        return ChatOpenAI(
-            model=model_name,
-            temperature=temperature if temperature is not None else 0.3,
-            api_key=self.settings.openai_api_key,
+        return _build_llm(
+            model_name,
+            temperature if temperature is not None else 0.3,
+            self.settings.openai_api_key,
+            f"travel-planner:{self.agent_name}",
         )
 
     def get_structured_llm(self, output_schema: Type[BaseModel]) -> ChatOpenAI:
@@ -69,7 +150,11 @@ class BaseAgent(ABC):
         Returns:
             LLM with structured output configuration.
         """
-        return self.llm.with_structured_output(output_schema)
+        structured_llm = self._structured_llms.get(output_schema)
+        if structured_llm is None:
+            structured_llm = self.llm.with_structured_output(output_schema)
+            self._structured_llms[output_schema] = structured_llm
+        return structured_llm
 
     @abstractmethod
     async def run(self, state: AgentState) -> dict[str, Any]:
@@ -83,26 +168,29 @@ class BaseAgent(ABC):
         """
         pass
 
+    @staticmethod
+    def _sorted_allocations(allocations: list[dict] | None) -> list[dict]:
+        """Get city allocations sorted by visit_order."""
+        return sorted(allocations or [], key=lambda x: x.get("visit_order", 0))
+
+    @staticmethod
+    def _city_index(state: AgentState) -> dict[str, dict]:
+        """Get a city name -> allocation mapping for the state's allocations."""
+        city_index: dict[str, dict] = {}
+        for allocation in state.get("city_allocations", []):
+            city_index.setdefault(allocation.get("city"), allocation)
+        return city_index
+
     def _extract_cities(self, state: AgentState) -> list[str]:
         """Extract list of cities from state.
 
-        Helper method to get cities from city_allocations.
+        Helper method to get cities from city_allocations, in visit order.
         """
-        allocations = state.get("city_allocations", [])
-        if not allocations:
-            return []
-
-        # Sort by visit_order and extract city names
-        sorted_allocations = sorted(allocations, key=lambda x: x.get("visit_order", 0))
-        return [a["city"] for a in sorted_allocations]
+        return [a["city"] for a in self._sorted_allocations(state.get("city_allocations", []))]
 
     def _get_city_days(self, state: AgentState, city: str) -> int:
         """Get number of days allocated to a city."""
-        allocations = state.get("city_allocations", [])
-        for allocation in allocations:
-            if allocation.get("city") == city:
-                return allocation.get("days", 1)
-        return 1
+        return self._city_index(state).get(city, {}).get("days", 1)
 
     def _format_attractions_for_city(
         self, state: AgentState, city: str
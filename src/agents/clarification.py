@@ -1,10 +1,12 @@
 """Clarification Agent - Gathers user preferences before planning."""
 
-from typing import Any
+import re
+from typing import Any, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.agents.base import BaseAgent
+from src.config.constants import KNOWN_DESTINATION_CITIES
 from src.models.agent_outputs import ClarificationOutput
 from src.models.state import AgentState
 
@@ -77,6 +79,39 @@ Request: "5 days in Tokyo and Kyoto from New York, Jan 10-15 2026, relaxed pace,
 - needs_clarification=False, ready_to_plan=True
 """
 
+CLARIFICATION_SYSTEM_MESSAGE = SystemMessage(content=CLARIFICATION_SYSTEM_PROMPT)
+
+
+# Heuristics for spotting requests that already answer every essential
+# question, so the LLM call can be skipped entirely
+_MONTHS = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|"
+    r"aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_DATE_RE = re.compile(
+    rf"\b\d{{4}}-\d{{2}}-\d{{2}}\b|\b{_MONTHS}\.?\s+\d{{1,2}}\b|\b\d{{1,2}}\s+{_MONTHS}\b",
+    re.IGNORECASE,
+)
+_FROM_RE = re.compile(rf"\bfrom\s+(?!(?i:{_MONTHS})\b)[A-Z][a-zA-Z]+")
+# Destination lists after "to", "in" or "visit"; each listed name must be a
+# known city, since a region or country ("Rajasthan", "Japan") still needs a
+# specific_destinations question
+_PLACE = rf"(?!(?i:{_MONTHS})\b)[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*"
+_PLACE_SEPARATOR = r"\s*,\s*(?:and\s+)?|\s+and\s+"
+_DEST_RE = re.compile(
+    rf"\b(?i:to|in|visit(?:ing)?)\s+({_PLACE}(?:(?:{_PLACE_SEPARATOR}){_PLACE})*)"
+)
+_PLACE_SEPARATOR_RE = re.compile(_PLACE_SEPARATOR)
+_DIET_RE = re.compile(
+    r"\b(?:vegetarian|vegan|non[- ]?veg(?:etarian)?|halal|kosher|gluten[- ]free|"
+    r"no (?:dietary |food )?restrictions)\b",
+    re.IGNORECASE,
+)
+_PACE_RE = re.compile(
+    r"\b(?:relaxed|leisurely|fast[- ]paced|(?:slow|moderate|fast|balanced|easy)\s+pace)\b",
+    re.IGNORECASE,
+)
+
 
 class ClarificationAgent(BaseAgent):
     """Clarification Agent for gathering user preferences.
@@ -90,6 +125,7 @@ class ClarificationAgent(BaseAgent):
     """
 
     agent_name = "clarification"
+    output_schemas = (ClarificationOutput,)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", 0.3)
@@ -106,10 +142,14 @@ class ClarificationAgent(BaseAgent):
         """
         user_request = state["user_request"]
 
+        quick_result = self._quick_check(user_request)
+        if quick_result is not None:
+            return quick_result
+
         structured_llm = self.get_structured_llm(ClarificationOutput)
 
         messages = [
-            SystemMessage(content=CLARIFICATION_SYSTEM_PROMPT),
+            CLARIFICATION_SYSTEM_MESSAGE,
             HumanMessage(
                 content=f"Analyze this travel request and determine what clarification is needed:\n\n{user_request}"
             ),
@@ -119,5 +159,44 @@ class ClarificationAgent(BaseAgent):
 
         return {
             "clarification_needed": result.needs_clarification,
-            "clarification_questions": [q.model_dump() for q in result.questions],
+            "clarification_questions": result.model_dump(include={"questions"})["questions"],
         }
+
+    def _quick_check(self, user_request: str) -> Optional[dict[str, Any]]:
+        """Skip the LLM when the request clearly covers every essential detail.
+
+        Args:
+            user_request: The user's travel request.
+
+        Returns:
+            State updates with no questions if dates, origin, known cities,
+            dietary preference and pace are all present, otherwise None.
+        """
+        patterns = (_DATE_RE, _FROM_RE, _DIET_RE, _PACE_RE)
+        if self._names_known_cities(user_request) and all(
+            p.search(user_request) for p in patterns
+        ):
+            return {
+                "clarification_needed": False,
+                "clarification_questions": [],
+            }
+        return None
+
+    def _names_known_cities(self, user_request: str) -> bool:
+        """Check that every destination the request names is a known city.
+
+        Args:
+            user_request: The user's travel request.
+
+        Returns:
+            True if at least one destination is named and all of them are in
+            KNOWN_DESTINATION_CITIES.
+        """
+        destinations = [
+            name.lower()
+            for match in _DEST_RE.finditer(user_request)
+            for name in _PLACE_SEPARATOR_RE.split(match.group(1))
+        ]
+        return bool(destinations) and all(
+            name in KNOWN_DESTINATION_CITIES for name in destinations
+        )
@@ -1,12 +1,19 @@
 """Critic/Validator Agent - Validates the entire plan and triggers re-planning if needed."""
 
+import asyncio
+from collections import defaultdict
 from typing import Any
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.agents.base import BaseAgent
-from src.config.constants import CRITIC_TEMPERATURE
-from src.config.settings import get_settings
+from src.config.constants import (
+    CRITIC_ATTRACTIONS_PER_CITY,
+    CRITIC_MAX_FEEDBACK_ISSUES,
+    CRITIC_MAX_ISSUES,
+    CRITIC_MAX_NAME_CHARS,
+    CRITIC_TEMPERATURE,
+)
 from src.models.agent_outputs import CriticOutput, IssueSeverity, ValidationIssue
 from src.models.state import AgentState
 
@@ -63,6 +70,19 @@ When requiring re-planning, provide SPECIFIC instructions:
 Be fair but thorough. A good trip plan should pass validation.
 """
 
+CRITIC_SYSTEM_MESSAGE = SystemMessage(content=CRITIC_SYSTEM_PROMPT)
+
+_SEVERITY_RANK = {
+    IssueSeverity.CRITICAL: 0,
+    IssueSeverity.HIGH: 1,
+    IssueSeverity.MEDIUM: 2,
+    IssueSeverity.LOW: 3,
+}
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate text to at most limit characters, marking the cut."""
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
 
 class CriticAgent(BaseAgent):
     """Critic/Validator Agent for plan validation.
@@ -78,11 +98,11 @@ class CriticAgent(BaseAgent):
     """
 
     agent_name = "critic"
+    output_schemas = (CriticOutput,)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", CRITIC_TEMPERATURE)
         super().__init__(**kwargs)
-        self.settings = get_settings()
 
     async def run(self, state: AgentState) -> dict[str, Any]:
         """Execute plan validation.
@@ -107,8 +127,10 @@ class CriticAgent(BaseAgent):
         transport_options = state.get("transport_options", [])
         budget_breakdown = state.get("budget_breakdown", {})
 
-        # Build comprehensive summary for validation
-        human_content = self._build_validation_prompt(
+        # Build comprehensive summary for validation (off the event loop,
+        # so concurrent planning sessions keep progressing)
+        human_content = await asyncio.to_thread(
+            self._build_validation_prompt,
             trip_summary=trip_summary,
             city_allocations=city_allocations,
             route_validation=route_validation,
@@ -124,17 +146,25 @@ class CriticAgent(BaseAgent):
         structured_llm = self.get_structured_llm(CriticOutput)
 
         messages = [
-            SystemMessage(content=CRITIC_SYSTEM_PROMPT),
+            CRITIC_SYSTEM_MESSAGE,
             HumanMessage(content=human_content),
         ]
 
         result: CriticOutput = await structured_llm.ainvoke(messages)
 
+        # Most severe issues first, and only as many as downstream prompts need
+        result.issues = sorted(
+            result.issues, key=lambda i: _SEVERITY_RANK[i.severity]
+        )[:CRITIC_MAX_ISSUES]
+
         # Check if we've hit max iterations
         if iteration >= max_iterations and result.requires_replanning:
             # Force approval after max iterations with warning
             result.is_valid = True
             result.requires_replanning = False
+            # Always keep the note explaining the forced approval, even when
+            # the LLM's issues already fill the cap
+            del result.issues[CRITIC_MAX_ISSUES - 1:]
             result.issues.append(
                 ValidationIssue(
                     category="process",
@@ -144,24 +174,17 @@ class CriticAgent(BaseAgent):
             )
 
         # Build state update
-        validation_result = {
-            "is_valid": result.is_valid,
-            "overall_score": result.overall_score,
-            "issues": [
-                {
-                    "category": issue.category,
-                    "description": issue.description,
-                    "severity": issue.severity.value,
-                    "affected_days": issue.affected_days,
-                    "affected_cities": issue.affected_cities,
-                    "suggested_fix": issue.suggested_fix,
-                }
-                for issue in result.issues
-            ],
-            "requires_replanning": result.requires_replanning,
-            "strengths": result.strengths,
-            "final_recommendations": result.final_recommendations,
-        }
+        validation_result = result.model_dump(
+            mode="json",
+            include={
+                "is_valid",
+                "overall_score",
+                "issues",
+                "requires_replanning",
+                "strengths",
+                "final_recommendations",
+            },
+        )
 
         state_update = {
             "validation_result": validation_result,
@@ -175,11 +198,15 @@ class CriticAgent(BaseAgent):
             if result.replan_instructions:
                 feedback_parts.append(f"Instructions: {result.replan_instructions}")
 
-            # Add critical/high issues as specific feedback
-            critical_issues = [
-                i for i in result.issues
-                if i.severity in (IssueSeverity.CRITICAL, IssueSeverity.HIGH)
-            ]
+            # Add critical/high issues as specific feedback (issues are
+            # sorted by severity, so stop at the first lesser one)
+            critical_issues = []
+            for issue in result.issues:
+                if issue.severity not in (IssueSeverity.CRITICAL, IssueSeverity.HIGH):
+                    break
+                critical_issues.append(issue)
+                if len(critical_issues) >= CRITIC_MAX_FEEDBACK_ISSUES:
+                    break
             if critical_issues:
                 feedback_parts.append("\nCritical issues to address:")
                 for issue in critical_issues:
@@ -214,7 +241,7 @@ class CriticAgent(BaseAgent):
         # Cities summary
         cities_info = ""
         if city_allocations:
-            sorted_cities = sorted(city_allocations, key=lambda x: x.get("visit_order", 0))
+            sorted_cities = self._sorted_allocations(city_allocations)
             cities_info = "\n".join(
                 f"  {c['visit_order']}. {c['city']}, {c['country']} - {c['days']} days"
                 for c in sorted_cities
@@ -229,27 +256,42 @@ class CriticAgent(BaseAgent):
                 for s in route_segments
             )
 
-        # Attractions by city
-        attractions_by_city = {}
+        # Attractions by city (only the first few per city reach the prompt)
+        attractions_by_city: defaultdict[str, list] = defaultdict(list)
         for attr in attractions:
-            city = attr.get("city", "Unknown")
-            if city not in attractions_by_city:
-                attractions_by_city[city] = []
-            attractions_by_city[city].append(attr)
+            bucket = attractions_by_city[attr.get("city", "Unknown")]
+            if len(bucket) < CRITIC_ATTRACTIONS_PER_CITY:
+                bucket.append(attr)
 
-        attractions_info = ""
+        attractions_parts = []
         for city, attrs in attractions_by_city.items():
-            attractions_info += f"\n  {city}:\n"
-            for a in attrs[:5]:  # Limit to 5 per city for prompt length
-                duration = a.get("estimated_duration_hours", "?")
-                attractions_info += f"    - {a.get('name', 'Unknown')} ({duration}h)\n"
+            attractions_parts.append(f"\n  {city}:\n")
+            attractions_parts.extend(
+                f"    - {_truncate(str(a.get('name', 'Unknown')), CRITIC_MAX_NAME_CHARS)}"
+                f" ({a.get('estimated_duration_hours', '?')}h)\n"
+                for a in attrs
+            )
+        attractions_info = "".join(attractions_parts)
 
-        # Budget info
+        # Budget info - only the numeric cost lines; tips and notes don't
+        # help validation and would bloat the prompt
         budget_info = ""
         if budget_breakdown:
+            cost_lines = ", ".join(
+                f"{k}: ${v}"
+                for k, v in budget_breakdown.items()
+                if k != "total" and isinstance(v, (int, float))
+            )
             budget_info = f"""
   Total: ${budget_breakdown.get('total', 'Unknown')}
-  Breakdown: {budget_breakdown}"""
+  Breakdown: {cost_lines or 'N/A'}"""
+
+        # Route warnings - count plus the first few
+        warnings = route_validation.get("warnings", [])
+        warnings_info = f"{len(warnings)}"
+        if warnings:
+            warnings_info += " (" + "; ".join(str(w) for w in warnings[:3])
+            warnings_info += ", ...)" if len(warnings) > 3 else ")"
 
         prompt = f"""Please validate this travel plan:
 
@@ -266,7 +308,7 @@ Traveler Profile: {trip_summary.get('traveler_profile', 'N/A')}
 === ROUTE ===
 Valid: {route_validation.get('is_valid', 'Unknown')}
 Total Travel Time: {route_validation.get('total_travel_time_hours', 'Unknown')} hours
-Warnings: {route_validation.get('warnings', [])}
+Warnings: {warnings_info}
 
 Route Segments:
 {route_info if route_info else '  No route segments'}
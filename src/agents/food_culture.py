@@ -1,19 +1,34 @@
 """Food/Culture Agent - Provides food recommendations and cultural tips."""
 
 import asyncio
-import json
+import hashlib
+import io
 import logging
+import sys
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
+from rapidfuzz import fuzz, process
 
 
 logger = logging.getLogger(__name__)
 
 from src.agents.base import BaseAgent
-from src.config.constants import FOOD_CULTURE_TEMPERATURE
+from src.cache.memory_cache import MemoryCache
+from src.config.constants import (
+    FOOD_CULTURE_CACHE_MAX_SIZE,
+    FOOD_CULTURE_MATCH_SCORE_CUTOFF,
+    FOOD_CULTURE_MAX_CONCURRENT_CITIES,
+    FOOD_CULTURE_REVIEWS_FOR_MATCHING,
+    FOOD_CULTURE_REVIEWS_IN_PROMPT,
+    FOOD_CULTURE_TEMPERATURE,
+    REVIEW_CACHE_MAX_SIZE,
+    REVIEW_CACHE_TTL_SECONDS,
+)
 from src.models.agent_outputs import FoodCultureOutput
-from src.models.itinerary import BudgetLevel
+from src.models.itinerary import BudgetLevel, Meal
 from src.models.state import AgentState
 from src.tools.google_api import (
     search_restaurants_places_api,
@@ -26,14 +41,32 @@ from src.tools.browser.restaurant_review_tools import (
 
 
 # India cities for Zomato/Swiggy integration
-INDIA_CITIES = {
+INDIA_CITIES = frozenset({
     "delhi", "mumbai", "bangalore", "bengaluru", "chennai", "kolkata",
     "hyderabad", "pune", "jaipur", "udaipur", "jodhpur", "goa", "agra",
     "varanasi", "lucknow", "kochi", "trivandrum", "mysore", "shimla",
     "manali", "rishikesh", "haridwar", "amritsar", "chandigarh", "ahmedabad",
     "surat", "indore", "bhopal", "nagpur", "aurangabad", "nashik", "coimbatore",
     "madurai", "thiruvananthapuram", "cochin", "ooty", "munnar", "alleppey",
-}
+})
+
+
+@lru_cache(maxsize=256)
+def _is_india(city: str, country: str) -> bool:
+    """Check whether a destination is in India (enables Zomato/Swiggy)."""
+    return city.lower() in INDIA_CITIES or country.lower() == "india"
+
+
+# Scraped reviews keyed by (city, country), so replans and concurrent
+# sessions don't re-scrape the same city
+_REVIEW_CACHE: MemoryCache[tuple[str, str], list[dict]] = MemoryCache(
+    REVIEW_CACHE_MAX_SIZE, REVIEW_CACHE_TTL_SECONDS
+)
+
+# Per-city LLM outputs keyed by a hash of the prompt inputs
+_RECOMMENDATION_CACHE: MemoryCache[str, FoodCultureOutput] = MemoryCache(
+    FOOD_CULTURE_CACHE_MAX_SIZE
+)
 
 
 FOOD_CULTURE_SYSTEM_PROMPT = """You are an expert in local cuisine and cultural practices. Your job is to provide authentic food recommendations and cultural guidance for travelers.
@@ -78,6 +111,34 @@ When real restaurant reviews are provided:
 - Use the scraped source (google_maps, zomato, swiggy) in your output
 """
 
+FOOD_CULTURE_SYSTEM_MESSAGE = SystemMessage(content=FOOD_CULTURE_SYSTEM_PROMPT)
+
+# Per-city request; filled with str.format so the prompt text lives in one place
+FOOD_CULTURE_HUMAN_TEMPLATE = """Provide food and cultural recommendations for {city}, {country}.
+
+Trip details:
+- Days in {city}: {days}
+- Budget level: {budget_level}
+- Traveler type: {traveler_profile}
+{dietary_info}
+{reviews_section}
+Please provide:
+1. 3-5 must-try local dishes
+2. Restaurant recommendations with SPECIFIC meal types:
+   - {days} BREAKFAST spots (meal_type: "breakfast") - local breakfast places, cafes
+   - {days} LUNCH restaurants (meal_type: "lunch") - good for midday meals
+   - {days} DINNER restaurants (meal_type: "dinner") - evening dining options
+3. Street food tips
+4. Cultural dos and don'ts
+5. Dress code guidance
+6. Any language tips
+
+IMPORTANT:
+- Each restaurant recommendation MUST have the correct meal_type set to exactly one of: "breakfast", "lunch", or "dinner".
+- When real review data is provided above, USE THOSE RESTAURANT NAMES in your recommendations.
+- Focus on authentic local experiences appropriate for the budget level.
+"""
+
 
 class FoodCultureAgent(BaseAgent):
     """Food/Culture Agent for dining and cultural recommendations.
@@ -92,6 +153,7 @@ class FoodCultureAgent(BaseAgent):
     """
 
     agent_name = "food_culture"
+    output_schemas = (FoodCultureOutput,)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", FOOD_CULTURE_TEMPERATURE)
@@ -122,101 +184,68 @@ class FoodCultureAgent(BaseAgent):
         all_food_recommendations = []
         all_cultural_tips = []
 
-        # Process all cities in PARALLEL for speed
+        # Process all cities in PARALLEL for speed, bounded so long trips
+        # don't burst past the API rate limits. A slot covers a city's whole
+        # pass: scrape, LLM call and merging its results
+        semaphore = asyncio.Semaphore(FOOD_CULTURE_MAX_CONCURRENT_CITIES)
+
         async def process_city(allocation):
-            city = allocation.get("city", "")
+            city = allocation["city"]
             country = allocation.get("country", "")
             days = allocation.get("days", 1)
 
-            if not city:
-                return [], []
-
-            logger.info(f"Getting food recommendations for {city}...")
-
-            # Get restaurant data from Google Places API
-            scraped_reviews = await self._scrape_restaurant_reviews(city, country)
-            logger.info(f"Found {len(scraped_reviews)} restaurants for {city}")
-
-            result = await self._get_city_recommendations(
-                city=city,
-                country=country,
-                days=days,
-                budget_level=budget_level,
-                traveler_profile=traveler_profile,
-                dietary_preferences=dietary_preferences,
-                scraped_reviews=scraped_reviews,
-            )
-
-            city_recommendations = []
-            city_tips = []
-
-            # Add food recommendations with review data
-            for meal in result.restaurant_recommendations:
-                # Try to match with scraped review data
-                review_data = self._find_matching_review(
-                    meal.restaurant_name, scraped_reviews
+            async with semaphore:
+                logger.info(f"Getting food recommendations for {city}...")
+
+                # Get restaurant data from Google Places API
+                scraped_reviews = await self._scrape_restaurant_reviews(city, country)
+                logger.info(f"Found {len(scraped_reviews)} restaurants for {city}")
+
+                result = await self._get_city_recommendations(
+                    city=city,
+                    country=country,
+                    days=days,
+                    budget_level=budget_level,
+                    traveler_profile=traveler_profile,
+                    dietary_preferences=dietary_preferences,
+                    scraped_reviews=scraped_reviews,
                 )
 
-                food_rec = {
-                    "city": city,
-                    "meal_type": meal.meal_type,
-                    "restaurant_name": meal.restaurant_name,
-                    "cuisine_type": meal.cuisine_type,
-                    "budget_level": meal.budget_level.value,
-                    "estimated_cost_usd": meal.estimated_cost_usd,
-                    "address": meal.address,
-                    "must_try_dishes": meal.must_try_dishes,
-                    "dietary_notes": meal.dietary_notes,
-                }
-
-                # Add review data if available
-                if review_data:
-                    food_rec["rating"] = review_data.get("rating")
-                    food_rec["review_count"] = review_data.get("review_count")
-                    food_rec["review_source"] = review_data.get("source")
-                    food_rec["review_highlights"] = review_data.get("review_highlights", [])
-                    food_rec["popular_dishes_from_reviews"] = review_data.get("popular_dishes", [])
-                    food_rec["source_url"] = review_data.get("source_url")
-                    # Enhanced data from Google Places API
-                    food_rec["photo_urls"] = review_data.get("photo_urls", [])
-                    food_rec["google_maps_url"] = review_data.get("google_maps_url")
-                    food_rec["website"] = review_data.get("website")
-                    food_rec["phone"] = review_data.get("phone")
-                    food_rec["opening_hours"] = review_data.get("opening_hours", [])
-                else:
-                    food_rec["review_source"] = "llm_generated"
-                    food_rec["photo_urls"] = []
-
-                city_recommendations.append(food_rec)
-
-            # Collect cultural tips
-            city_tips.extend(result.cultural_dos)
-            city_tips.extend([f"Don't: {dont}" for dont in result.cultural_donts])
-
-            if result.dress_code_notes:
-                city_tips.append(f"Dress code: {result.dress_code_notes}")
-
-            if result.language_tips:
-                city_tips.append(f"Language: {result.language_tips}")
-
-            return city_recommendations, city_tips
+                # Add food recommendations with review data
+                review_index = self._build_review_index(scraped_reviews)
+                city_recommendations = [
+                    self._build_food_recommendation(
+                        city,
+                        meal,
+                        self._find_matching_review(meal.restaurant_name, review_index),
+                    )
+                    for meal in result.restaurant_recommendations
+                ]
+
+                # Collect cultural tips
+                city_tips = list(result.cultural_dos)
+                city_tips.extend("Don't: " + dont for dont in result.cultural_donts)
+
+                if result.dress_code_notes:
+                    city_tips.append(f"Dress code: {result.dress_code_notes}")
+
+                if result.language_tips:
+                    city_tips.append(f"Language: {result.language_tips}")
+
+                return city_recommendations, city_tips
 
         # Run all cities in parallel
-        city_tasks = [process_city(alloc) for alloc in city_allocations]
+        city_tasks = [
+            process_city(alloc) for alloc in city_allocations if alloc.get("city")
+        ]
         results = await asyncio.gather(*city_tasks)
 
         for recommendations, tips in results:
             all_food_recommendations.extend(recommendations)
             all_cultural_tips.extend(tips)
 
-        # Skip the old per-meal processing since we did it above
         # Deduplicate cultural tips while preserving order
-        seen = set()
-        unique_tips = []
-        for tip in all_cultural_tips:
-            if tip not in seen:
-                seen.add(tip)
-                unique_tips.append(tip)
+        unique_tips = list(dict.fromkeys(all_cultural_tips))
 
         return {
             "food_recommendations": all_food_recommendations,
@@ -234,6 +263,14 @@ class FoodCultureAgent(BaseAgent):
         scraped_reviews: list[dict] | None = None,
     ) -> FoodCultureOutput:
         """Get food and culture recommendations for a single city."""
+        cache_key = self._recommendation_key(
+            city, country, days, budget_level, traveler_profile,
+            dietary_preferences, scraped_reviews,
+        )
+        cached = _RECOMMENDATION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         dietary_info = ""
         if dietary_preferences:
             dietary_info = f"- Dietary preferences: {', '.join(dietary_preferences)}"
@@ -241,46 +278,95 @@ class FoodCultureAgent(BaseAgent):
         # Build scraped reviews section
         reviews_section = self._build_reviews_section(scraped_reviews)
 
-        human_content = f"""Provide food and cultural recommendations for {city}, {country}.
-
-Trip details:
-- Days in {city}: {days}
-- Budget level: {budget_level}
-- Traveler type: {traveler_profile}
-{dietary_info}
-{reviews_section}
-Please provide:
-1. 3-5 must-try local dishes
-2. Restaurant recommendations with SPECIFIC meal types:
-   - {days} BREAKFAST spots (meal_type: "breakfast") - local breakfast places, cafes
-   - {days} LUNCH restaurants (meal_type: "lunch") - good for midday meals
-   - {days} DINNER restaurants (meal_type: "dinner") - evening dining options
-3. Street food tips
-4. Cultural dos and don'ts
-5. Dress code guidance
-6. Any language tips
-
-IMPORTANT:
-- Each restaurant recommendation MUST have the correct meal_type set to exactly one of: "breakfast", "lunch", or "dinner".
-- When real review data is provided above, USE THOSE RESTAURANT NAMES in your recommendations.
-- Focus on authentic local experiences appropriate for the budget level.
-"""
+        human_content = FOOD_CULTURE_HUMAN_TEMPLATE.format(
+            city=city,
+            country=country,
+            days=days,
+            budget_level=budget_level,
+            traveler_profile=traveler_profile,
+            dietary_info=dietary_info,
+            reviews_section=reviews_section,
+        )
 
         structured_llm = self.get_structured_llm(FoodCultureOutput)
 
         messages = [
-            SystemMessage(content=FOOD_CULTURE_SYSTEM_PROMPT),
+            FOOD_CULTURE_SYSTEM_MESSAGE,
             HumanMessage(content=human_content),
         ]
 
         result = await structured_llm.ainvoke(messages)
         result.city = city
+
+        _RECOMMENDATION_CACHE.set(cache_key, result)
         return result
 
+    def _recommendation_key(
+        self,
+        city: str,
+        country: str,
+        days: int,
+        budget_level: str,
+        traveler_profile: str,
+        dietary_preferences: list[str] | None,
+        scraped_reviews: list[dict] | None,
+    ) -> str:
+        """Hash the inputs that shape a city's food/culture prompt."""
+        review_signature = [
+            (r.get("name"), r.get("rating"), r.get("source"))
+            for r in (scraped_reviews or [])[:FOOD_CULTURE_REVIEWS_IN_PROMPT]
+        ]
+        payload = orjson.dumps(
+            {
+                "city": city,
+                "country": country,
+                "days": days,
+                "budget_level": budget_level,
+                "traveler_profile": traveler_profile,
+                "dietary_preferences": sorted(dietary_preferences or []),
+                "reviews": review_signature,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     async def _scrape_restaurant_reviews(
         self,
         city: str,
         country: str,
+    ) -> list[dict]:
+        """Get restaurant data for a city, reusing recently scraped results.
+
+        Args:
+            city: City name.
+            country: Country name.
+
+        Returns:
+            List of restaurant data from all sources.
+        """
+        key = (city.lower(), country.lower())
+        cached = _REVIEW_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        async with _REVIEW_CACHE.lock(key):
+            # Another request may have scraped this city while we waited
+            cached = _REVIEW_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+            reviews = await self._fetch_restaurant_reviews(city, country)
+
+            # Don't pin a failed scrape (every source down) for the TTL
+            if reviews:
+                _REVIEW_CACHE.set(key, reviews)
+            return reviews
+
+    async def _fetch_restaurant_reviews(
+        self,
+        city: str,
+        country: str,
     ) -> list[dict]:
         """Get restaurant data from Google Places API and other sources.
 
@@ -292,52 +378,38 @@ IMPORTANT:
             List of restaurant data from all sources.
         """
         all_reviews = []
-        is_india = (
-            city.lower() in INDIA_CITIES or
-            country.lower() == "india"
-        )
+        is_india = _is_india(city, country)
 
-        # Use Google Places API (much more reliable and detailed than scraping)
-        try:
-            google_result = await search_restaurants_places_api.ainvoke({
-                "city": city,
-                "max_results": 20,
-            })
-            parsed = json.loads(google_result)
-            if not parsed.get("error"):
-                for r in parsed.get("restaurants", []):
-                    r["source"] = "google_places_api"
-                    all_reviews.append(r)
-        except Exception:
-            pass
-
-        # For India, also try Zomato and Swiggy for additional options
+        # Google Places API (much more reliable and detailed than scraping);
+        # for India, also try Zomato and Swiggy for additional options.
+        # The sources are independent, so fetch them concurrently.
+        sources = [("google_places_api", search_restaurants_places_api, 20)]
         if is_india:
-            try:
-                zomato_result = await scrape_zomato_restaurants.ainvoke({
-                    "city": city,
-                    "max_results": 10,
-                })
-                parsed = json.loads(zomato_result)
-                if not parsed.get("error"):
-                    for r in parsed.get("restaurants", []):
-                        r["source"] = "zomato"
-                        all_reviews.append(r)
-            except Exception:
-                pass
+            sources.append(("zomato", scrape_zomato_restaurants, 10))
+            sources.append(("swiggy", scrape_swiggy_restaurants, 10))
+
+        results = await asyncio.gather(
+            *(
+                tool.ainvoke({"city": city, "max_results": max_results})
+                for _, tool, max_results in sources
+            ),
+            return_exceptions=True,
+        )
 
+        for (source, _, _), raw_result in zip(sources, results):
+            if isinstance(raw_result, BaseException):
+                continue
             try:
-                swiggy_result = await scrape_swiggy_restaurants.ainvoke({
-                    "city": city,
-                    "max_results": 10,
-                })
-                parsed = json.loads(swiggy_result)
-                if not parsed.get("error"):
-                    for r in parsed.get("restaurants", []):
-                        r["source"] = "swiggy"
-                        all_reviews.append(r)
-            except Exception:
-                pass
+                parsed = orjson.loads(raw_result)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(parsed, dict) or parsed.get("error"):
+                continue
+            for r in parsed.get("restaurants", []):
+                r["source"] = source
+                # Normalized once here; matching reuses it on every (cached) run
+                r["_name_lower"] = (r.get("name") or "").lower().strip()
+                all_reviews.append(r)
 
         # Sort by rating and review count (highest first)
         all_reviews.sort(
@@ -347,6 +419,56 @@ IMPORTANT:
 
         return all_reviews
 
+    def _build_food_recommendation(
+        self,
+        city: str,
+        meal: Meal,
+        review_data: Optional[dict],
+    ) -> dict:
+        """Build a food recommendation entry, enriched with review data if matched.
+
+        Args:
+            city: City the meal belongs to.
+            meal: Meal recommended by the LLM.
+            review_data: Matching scraped review, if any.
+
+        Returns:
+            Food recommendation dict for the graph state.
+        """
+        food_rec = {
+            "city": city,
+            # A handful of distinct values repeated across every city's meals
+            "meal_type": sys.intern(meal.meal_type),
+            "restaurant_name": meal.restaurant_name,
+            "cuisine_type": meal.cuisine_type,
+            "budget_level": meal.budget_level.value,
+            "estimated_cost_usd": meal.estimated_cost_usd,
+            "address": meal.address,
+            "must_try_dishes": meal.must_try_dishes,
+            "dietary_notes": meal.dietary_notes,
+        }
+
+        if not review_data:
+            food_rec["review_source"] = "llm_generated"
+            food_rec["photo_urls"] = []
+            return food_rec
+
+        food_rec.update({
+            "rating": review_data.get("rating"),
+            "review_count": review_data.get("review_count"),
+            "review_source": review_data.get("source"),
+            "review_highlights": review_data.get("review_highlights", []),
+            "popular_dishes_from_reviews": review_data.get("popular_dishes", []),
+            "source_url": review_data.get("source_url"),
+            # Enhanced data from Google Places API
+            "photo_urls": review_data.get("photo_urls", []),
+            "google_maps_url": review_data.get("google_maps_url"),
+            "website": review_data.get("website"),
+            "phone": review_data.get("phone"),
+            "opening_hours": review_data.get("opening_hours", []),
+        })
+        return food_rec
+
     def _build_reviews_section(self, scraped_reviews: list[dict] | None) -> str:
         """Build the reviews section for the LLM prompt.
 
@@ -359,81 +481,98 @@ IMPORTANT:
         if not scraped_reviews:
             return ""
 
-        lines = ["\nREAL RESTAURANT REVIEWS (from Google Maps, Zomato, Swiggy):"]
-        lines.append("(Prioritize these highly-rated restaurants in your recommendations)\n")
+        buf = io.StringIO()
+        buf.write("\nREAL RESTAURANT REVIEWS (from Google Maps, Zomato, Swiggy):")
+        buf.write("\n(Prioritize these highly-rated restaurants in your recommendations)\n")
 
-        for r in scraped_reviews[:15]:  # Limit to top 15
-            name = r.get("name", "Unknown")
+        for r in scraped_reviews[:FOOD_CULTURE_REVIEWS_IN_PROMPT]:
             rating = r.get("rating")
             review_count = r.get("review_count")
-            source = r.get("source", "unknown")
             cuisines = r.get("cuisine_types", [])
             price_level = r.get("price_level", "unknown")
 
-            line = f"- {name}"
+            buf.write(f"\n- {r.get('name', 'Unknown')}")
             if rating:
-                line += f" ★{rating:.1f}"
+                buf.write(f" ★{rating:.1f}")
             if review_count:
-                line += f" ({review_count:,} reviews)"
-            line += f" [{source}]"
+                buf.write(f" ({review_count:,} reviews)")
+            buf.write(f" [{r.get('source', 'unknown')}]")
 
             if cuisines:
-                line += f" | {', '.join(cuisines[:3])}"
+                buf.write(f" | {', '.join(cuisines[:3])}")
             if price_level and price_level != "unknown":
-                line += f" | {price_level}"
-
-            lines.append(line)
+                buf.write(f" | {price_level}")
 
             # Add review highlights if available
             highlights = r.get("review_highlights", [])
             if highlights:
-                lines.append(f"  → \"{highlights[0]}\"")
+                buf.write(f"\n  → \"{highlights[0]}\"")
 
             # Add popular dishes if available
             dishes = r.get("popular_dishes", [])
             if dishes:
-                lines.append(f"  → Popular: {', '.join(dishes[:3])}")
+                buf.write(f"\n  → Popular: {', '.join(dishes[:3])}")
+
+        return buf.getvalue()
+
+    def _build_review_index(self, scraped_reviews: list[dict] | None) -> dict:
+        """Index scraped reviews by normalized name for restaurant matching.
+
+        Args:
+            scraped_reviews: List of scraped reviews.
 
-        return "\n".join(lines)
+        Returns:
+            Dict with "exact" (name -> review, first occurrence wins), plus
+            "choices" (names) and "reviews" for fuzzy matching against the
+            top-ranked reviews only, in original order.
+        """
+        exact: dict[str, dict] = {}
+        choices: list[str] = []
+        reviews: list[dict] = []
+        for i, r in enumerate(scraped_reviews or []):
+            scraped_name = r.get("_name_lower")
+            if scraped_name is None:
+                scraped_name = (r.get("name") or "").lower().strip()
+            exact.setdefault(scraped_name, r)
+            # Fuzzy matches against low-ranked entries are rarely right
+            if i < FOOD_CULTURE_REVIEWS_FOR_MATCHING:
+                choices.append(scraped_name)
+                reviews.append(r)
+
+        return {"exact": exact, "choices": choices, "reviews": reviews}
 
     def _find_matching_review(
         self,
         restaurant_name: Optional[str],
-        scraped_reviews: list[dict] | None,
+        review_index: dict,
     ) -> Optional[dict]:
         """Find a matching review for a restaurant name.
 
         Args:
             restaurant_name: Name of the restaurant to match.
-            scraped_reviews: List of scraped reviews.
+            review_index: Index from _build_review_index.
 
         Returns:
             Matching review data or None.
         """
-        if not restaurant_name or not scraped_reviews:
+        if not restaurant_name or not review_index["exact"]:
             return None
 
         name_lower = restaurant_name.lower().strip()
 
         # Try exact match first
-        for r in scraped_reviews:
-            scraped_name = (r.get("name") or "").lower().strip()
-            if scraped_name == name_lower:
-                return r
-
-        # Try partial match
-        for r in scraped_reviews:
-            scraped_name = (r.get("name") or "").lower().strip()
-            # Check if either name contains the other
-            if name_lower in scraped_name or scraped_name in name_lower:
-                return r
-
-            # Check if main words match
-            name_words = set(name_lower.split())
-            scraped_words = set(scraped_name.split())
-            common_words = name_words & scraped_words
-            # If more than half the words match, consider it a match
-            if len(common_words) >= min(len(name_words), len(scraped_words)) / 2:
-                return r
-
-        return None
+        exact_match = review_index["exact"].get(name_lower)
+        if exact_match is not None:
+            return exact_match
+
+        # Fall back to word-order-insensitive fuzzy matching; one name's words
+        # being a subset of the other's (e.g. "Tapri" vs "Tapri Central") scores 100
+        match = process.extractOne(
+            name_lower,
+            review_index["choices"],
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=FOOD_CULTURE_MATCH_SCORE_CUTOFF,
+        )
+        if match is None:
+            return None
+        return review_index["reviews"][match[2]]
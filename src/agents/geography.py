@@ -49,6 +49,8 @@ For each segment, provide:
 If the route is already optimal, confirm it. Only suggest changes if there's a clear improvement.
 """
 
+GEOGRAPHY_SYSTEM_MESSAGE = SystemMessage(content=GEOGRAPHY_SYSTEM_PROMPT)
+
 
 class GeographyAgent(BaseAgent):
     """Geography/Routing Agent for route validation and optimization.
@@ -63,6 +65,7 @@ class GeographyAgent(BaseAgent):
     """
 
     agent_name = "geography"
+    output_schemas = (GeographyOutput,)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", GEOGRAPHY_TEMPERATURE)
@@ -90,9 +93,7 @@ class GeographyAgent(BaseAgent):
             }
 
         # Sort by visit order to get the proposed route
-        sorted_cities = sorted(
-            city_allocations, key=lambda x: x.get("visit_order", 0)
-        )
+        sorted_cities = self._sorted_allocations(city_allocations)
         proposed_order = [c["city"] for c in sorted_cities]
 
         # Build context for the LLM
@@ -122,7 +123,7 @@ Please:
         structured_llm = self.get_structured_llm(GeographyOutput)
 
         messages = [
-            SystemMessage(content=GEOGRAPHY_SYSTEM_PROMPT),
+            GEOGRAPHY_SYSTEM_MESSAGE,
             HumanMessage(content=human_content),
         ]
 
@@ -158,12 +159,11 @@ Please:
         if result.route_changed:
             # Reorder city_allocations based on optimized_order
             city_map = {c["city"]: c for c in city_allocations}
-            updated_allocations = []
-            for i, city_name in enumerate(result.optimized_order, 1):
-                if city_name in city_map:
-                    allocation = city_map[city_name].copy()
-                    allocation["visit_order"] = i
-                    updated_allocations.append(allocation)
+            updated_allocations = [
+                {**city_map[city_name], "visit_order": i}
+                for i, city_name in enumerate(result.optimized_order, 1)
+                if city_name in city_map
+            ]
 
         state_update = {
             "route_validation": route_validation,
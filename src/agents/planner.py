@@ -1,11 +1,13 @@
 """Planner Agent - Understands user intent and allocates days to cities."""
 
+import hashlib
 from typing import Any
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.agents.base import BaseAgent
-from src.config.constants import PLANNER_TEMPERATURE
+from src.cache.memory_cache import MemoryCache
+from src.config.constants import PLANNER_CACHE_MAX_SIZE, PLANNER_TEMPERATURE
 from src.models.agent_outputs import PlannerOutput
 from src.models.state import AgentState
 
@@ -52,6 +54,32 @@ When re-planning based on critic feedback, carefully address the specific issues
 The critic_feedback field will contain specific instructions if this is a re-planning iteration.
 """
 
+PLANNER_SYSTEM_MESSAGE = SystemMessage(content=PLANNER_SYSTEM_PROMPT)
+
+
+# Plans keyed by normalized user request and any critic feedback, so
+# replayed requests (and their re-plans) skip the planning call
+_PLAN_CACHE: MemoryCache[str, PlannerOutput] = MemoryCache(PLANNER_CACHE_MAX_SIZE)
+
+
+def _request_key(
+    user_request: str,
+    critic_feedback: str | None = None,
+    iteration: int = 0,
+) -> str:
+    """Hash a planning request, ignoring whitespace differences.
+
+    Case is kept, since the planner sees the request verbatim and casing
+    can carry meaning (e.g. "Nice" vs "nice").
+
+    Re-plans also key on the critic feedback and iteration, which both
+    appear in the prompt.
+    """
+    normalized = " ".join(user_request.split())
+    if critic_feedback:
+        normalized += f"\0{iteration}\0{critic_feedback}"
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
 
 class PlannerAgent(BaseAgent):
     """Planner Agent for trip understanding and city allocation.
@@ -66,6 +94,7 @@ class PlannerAgent(BaseAgent):
     """
 
     agent_name = "planner"
+    output_schemas = (PlannerOutput,)
 
     def __init__(self, **kwargs):
         # Override temperature for planner
@@ -101,15 +130,19 @@ The previous plan had issues. Please address the following feedback:
 Make specific changes to address these issues while maintaining a coherent trip plan.
 """
 
-        # Get structured output from LLM
-        structured_llm = self.get_structured_llm(PlannerOutput)
+        cache_key = _request_key(user_request, critic_feedback, iteration)
+        result = _PLAN_CACHE.get(cache_key)
+        if result is None:
+            # Get structured output from LLM
+            structured_llm = self.get_structured_llm(PlannerOutput)
 
-        messages = [
-            SystemMessage(content=PLANNER_SYSTEM_PROMPT),
-            HumanMessage(content=human_content),
-        ]
+            messages = [
+                PLANNER_SYSTEM_MESSAGE,
+                HumanMessage(content=human_content),
+            ]
 
-        result: PlannerOutput = await structured_llm.ainvoke(messages)
+            result = await structured_llm.ainvoke(messages)
+            _PLAN_CACHE.set(cache_key, result)
 
         # Convert to state update format
         trip_summary = {
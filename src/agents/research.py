@@ -1,23 +1,38 @@
 """Research/Browser Agent - Browses the web for attractions and current information."""
 
 import asyncio
-import json
 import logging
+import re
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
+from rapidfuzz import fuzz, process
 
 from src.agents.base import BaseAgent
-from src.config.constants import RESEARCH_TEMPERATURE, MAX_ATTRACTIONS_PER_CITY
-from src.models.agent_outputs import ResearchOutput
+from src.cache.memory_cache import MemoryCache
+from src.config.constants import (
+    ATTRACTION_DURATION_HOURS,
+    DEFAULT_ATTRACTION_DURATION_HOURS,
+    MAX_ATTRACTIONS_PER_CITY,
+    RESEARCH_CACHE_MAX_SIZE,
+    RESEARCH_CACHE_TTL_SECONDS,
+    RESEARCH_MATCH_SCORE_CUTOFF,
+    RESEARCH_MAX_CONCURRENT_CITIES,
+    RESEARCH_TEMPERATURE,
+)
+from src.models.agent_outputs import (
+    FallbackAttractionList,
+    FallbackHotelList,
+    ResearchOutput,
+)
 from src.models.itinerary import Attraction
 from src.models.state import AgentState
-from src.tools.browser.playwright_tools import search_attractions, get_attraction_details
 from src.tools.google_api import (
     search_attractions_places_api,
-    search_restaurants_places_api,
     search_hotels_places_api,
-    search_all_city_data,
 )
 
 
@@ -49,6 +64,123 @@ When processing search results:
 Output attractions in the structured format requested.
 """
 
+RESEARCH_SYSTEM_MESSAGE = SystemMessage(content=RESEARCH_SYSTEM_PROMPT)
+
+# Per-city structuring request; filled with str.format so the prompt text
+# lives in one place
+RESEARCH_HUMAN_TEMPLATE = """Process these search results for {city}, {country} into structured attraction data.
+
+The traveler will spend {days} days in {city}.
+{places_section}
+
+Please:
+1. Extract valid attractions from these results
+2. PRIORITIZE attractions from the Google Places API data (they have ratings, reviews, and photos)
+3. Remove duplicates and irrelevant entries
+4. Assign appropriate categories (landmark, museum, temple, nature, market, etc.)
+5. Estimate realistic visit durations
+6. Note any information about booking requirements
+7. Include the rating and review_count in your output when available
+8. Preserve photo_urls, google_maps_url, website, and phone from the Places API data
+
+Return structured attraction data for these results.
+"""
+
+# System prompts for the LLM fallbacks used when Places API is unavailable
+FALLBACK_ATTRACTIONS_SYSTEM_MESSAGE = SystemMessage(
+    content="You are a travel expert with extensive knowledge of tourist destinations worldwide. Generate accurate, real attraction data."
+)
+FALLBACK_HOTELS_SYSTEM_MESSAGE = SystemMessage(
+    content="You are a travel expert with knowledge of hotels worldwide. Generate accurate, real hotel data."
+)
+
+# Attraction fields filled from Google Places API data (omitted when empty)
+_PLACES_API_FIELDS = frozenset({
+    "rating",
+    "review_count",
+    "photo_urls",
+    "google_maps_url",
+    "website",
+    "phone",
+    "review_highlights",
+})
+
+# Punctuation ignored when matching attraction names to Places results
+_NAME_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Places API fields copied verbatim onto LLM-structured attractions
+_PLACES_COPY_FIELDS = (
+    "rating",
+    "review_count",
+    "photo_urls",
+    "google_maps_url",
+    "website",
+    "phone",
+)
+
+# Places API fields that must be present to skip LLM structuring
+_REQUIRED_PLACES_FIELDS = ("name", "category", "address", "editorial_summary")
+
+# Defaults the Places tools fill in when Google has no value; these count
+# as missing (see _parse_place and _categorize_attraction in google_api)
+_PLACES_PLACEHOLDERS = {"name": "Unknown", "category": "attraction"}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize a place name for matching (casefolded, punctuation-free).
+
+    Cached because the same attraction names recur across re-plans and trips.
+    """
+    return " ".join(_NAME_PUNCTUATION_RE.sub(" ", name.casefold()).split())
+
+
+def _places_value(place: dict, field: str) -> Any:
+    """Get a Places API field, treating tool-filled placeholders as missing."""
+    value = place.get(field)
+    if value == _PLACES_PLACEHOLDERS.get(field):
+        return None
+    return value
+
+
+def _attraction_to_dict(attraction: Attraction) -> dict:
+    """Convert an attraction to its state dict.
+
+    Places API enrichment fields are only included when the API actually
+    provided them.
+    """
+    return {
+        k: v for k, v in attraction.model_dump().items() if v or k not in _PLACES_API_FIELDS
+    }
+
+
+def _dedupe_by_name(results: list[dict]) -> list[dict]:
+    """Drop results whose normalized name was already seen.
+
+    Places API lists results by relevance, so the first occurrence is kept.
+    Unnamed results are left for the callers to filter.
+    """
+    seen: set[str] = set()
+    unique = []
+    for result in results:
+        name = result.get("name")
+        if name:
+            key = _normalize_name(name)
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(result)
+    return unique
+
+
+# Per-city research keyed by (city, country, days, budget_level), so
+# re-plans and repeat trips skip Places lookups and LLM structuring for
+# cities they keep
+_RESEARCH_CACHE: MemoryCache[
+    tuple[str, str, int, str],
+    tuple[list[Attraction], list[dict], list[str]],
+] = MemoryCache(RESEARCH_CACHE_MAX_SIZE, RESEARCH_CACHE_TTL_SECONDS)
+
 
 class ResearchAgent(BaseAgent):
     """Research/Browser Agent for finding attractions and current information.
@@ -63,6 +195,7 @@ class ResearchAgent(BaseAgent):
     """
 
     agent_name = "research"
+    output_schemas = (ResearchOutput, FallbackAttractionList, FallbackHotelList)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", RESEARCH_TEMPERATURE)
@@ -85,30 +218,116 @@ class ResearchAgent(BaseAgent):
                 "research_sources": [],
             }
 
-        all_attractions = []
-        all_hotels = []
-        all_sources = []
-
         budget_level = state.get("trip_summary", {}).get("budget_level", "mid_range")
 
-        # Research all cities in PARALLEL for speed
-        async def research_city(allocation):
-            city = allocation.get("city", "")
-            country = allocation.get("country", "")
-            days = allocation.get("days", 1)
+        # Research all cities in PARALLEL for speed, bounding concurrent
+        # Places API searches so long trips don't hit rate limits
+        semaphore = asyncio.Semaphore(RESEARCH_MAX_CONCURRENT_CITIES)
+        allocations = [alloc for alloc in city_allocations if alloc.get("city")]
 
-            if not city:
-                return [], [], []
+        async def research_city(index: int, allocation: dict):
+            return index, await self._research_city(allocation, budget_level, semaphore)
 
-            logger.info(f"Researching {city} with Google Places API...")
+        # Build each city's attraction dicts as soon as it finishes, while
+        # slower cities are still in flight; results keep visit order
+        city_results: list[tuple[list[dict], list[dict], list[str]]] = [
+            ([], [], []) for _ in allocations
+        ]
+        for next_city in asyncio.as_completed(
+            [research_city(i, alloc) for i, alloc in enumerate(allocations)]
+        ):
+            try:
+                index, (attractions, hotels, sources) = await next_city
+            except Exception as e:
+                logger.error(f"Research error: {e}")
+                continue
 
-            target_attractions = min(days * 4, MAX_ATTRACTIONS_PER_CITY)
-            city_attractions = []
-            city_hotels = []
-            city_sources = []
+            city_results[index] = (
+                list(map(_attraction_to_dict, attractions)),
+                hotels,
+                sources,
+            )
 
-            # Try Google Places API for attractions and hotels in parallel
-            try:
+        return {
+            "attractions": list(chain.from_iterable(r[0] for r in city_results)),
+            "hotels": list(chain.from_iterable(r[1] for r in city_results)),
+            "research_sources": list(chain.from_iterable(r[2] for r in city_results)),
+        }
+
+    async def _research_city(
+        self,
+        allocation: dict,
+        budget_level: str,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[Attraction], list[dict], list[str]]:
+        """Research a city, reusing recent results for the same stay.
+
+        Args:
+            allocation: City allocation with city, country and days.
+            budget_level: Trip budget level.
+            semaphore: Bounds concurrent Places API searches for this run.
+
+        Returns:
+            Tuple of (attractions, hotels, sources).
+        """
+        city = allocation.get("city", "")
+        country = allocation.get("country", "")
+        days = allocation.get("days", 1)
+
+        if not city:
+            return [], [], []
+
+        key = (city.lower(), country.lower(), days, budget_level)
+        cached = _RESEARCH_CACHE.get(key)
+        if cached is not None:
+            logger.info(f"Using cached research for {city}")
+            return cached
+
+        async with _RESEARCH_CACHE.lock(key):
+            # Another request may have researched this city while we waited
+            cached = _RESEARCH_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+            attractions, hotels, sources = await self._fetch_city_research(
+                city, country, days, budget_level, semaphore
+            )
+
+            # Don't pin a failed lookup for the TTL
+            if attractions and hotels:
+                _RESEARCH_CACHE.set(key, (attractions, hotels, sources))
+            return attractions, hotels, sources
+
+    async def _fetch_city_research(
+        self,
+        city: str,
+        country: str,
+        days: int,
+        budget_level: str,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[Attraction], list[dict], list[str]]:
+        """Find attractions and hotels for a city via Places API and LLM.
+
+        Args:
+            city: City name.
+            country: Country name.
+            days: Number of days in this city.
+            budget_level: Trip budget level.
+            semaphore: Bounds concurrent Places API searches for this run.
+
+        Returns:
+            Tuple of (attractions, hotels, sources).
+        """
+        logger.info(f"Researching {city} with Google Places API...")
+
+        target_attractions = min(days * 4, MAX_ATTRACTIONS_PER_CITY)
+        city_attractions = []
+        city_hotels = []
+        city_sources = []
+
+        # Try Google Places API for attractions and hotels in parallel
+        try:
+            async with semaphore:
                 attractions_result, hotels_result = await asyncio.gather(
                     search_attractions_places_api.ainvoke({
                         "city": city,
@@ -122,210 +341,292 @@ class ResearchAgent(BaseAgent):
                     return_exceptions=True,
                 )
 
-                # Process attractions
-                api_failed = False
-                if not isinstance(attractions_result, Exception):
-                    places_data = json.loads(attractions_result)
-                    if not places_data.get("error"):
-                        places_api_data = places_data.get("attractions", [])
-                        city_sources.append(f"Google Places API: {city} attractions")
-                        logger.info(f"Found {len(places_api_data)} attractions in {city}")
-
-                        if places_api_data:
-                            # Use LLM to structure
-                            structured = await self._structure_attractions(
-                                city=city,
-                                country=country,
-                                raw_data=places_api_data,
-                                days=days,
-                                places_api_data=places_api_data,
-                            )
-                            city_attractions = list(structured.attractions_found)
-                            city_sources.extend(structured.sources_browsed)
-                    else:
-                        logger.warning(f"Attractions API error for {city}: {places_data.get('error')}")
-                        api_failed = True
-                else:
-                    logger.error(f"Attractions exception for {city}: {attractions_result}")
-                    api_failed = True
-
-                # FALLBACK: Generate attractions using LLM if API failed
-                if api_failed or not city_attractions:
-                    logger.info(f"Using LLM fallback for {city} attractions...")
-                    fallback_attractions = await self._generate_fallback_attractions(
-                        city=city,
-                        country=country,
-                        days=days,
-                    )
-                    if fallback_attractions:
-                        city_attractions = fallback_attractions
-                        city_sources.append(f"LLM Knowledge Base: {city} attractions (API unavailable)")
-
-                # Process hotels
-                hotels_api_failed = False
-                if not isinstance(hotels_result, Exception):
-                    hotels_data = json.loads(hotels_result)
-                    if not hotels_data.get("error"):
-                        city_hotels = hotels_data.get("hotels", [])
-                        city_sources.append(f"Google Places API: {city} hotels")
-                        logger.info(f"Found {len(city_hotels)} hotels in {city}")
-                    else:
-                        logger.warning(f"Hotels API error for {city}: {hotels_data.get('error')}")
-                        hotels_api_failed = True
-                else:
-                    logger.error(f"Hotels exception for {city}: {hotels_result}")
-                    hotels_api_failed = True
-
-                # FALLBACK: Generate hotels using LLM if API failed
-                if hotels_api_failed or not city_hotels:
-                    logger.info(f"Using LLM fallback for {city} hotels...")
-                    fallback_hotels = await self._generate_fallback_hotels(
-                        city=city,
-                        country=country,
-                        budget_level=budget_level,
-                    )
-                    if fallback_hotels:
-                        city_hotels = fallback_hotels
-                        city_sources.append(f"LLM Knowledge Base: {city} hotels (API unavailable)")
+            # Attraction structuring/fallback and hotel fallback are
+            # independent LLM calls, so resolve both concurrently
+            (city_attractions, attraction_sources), (city_hotels, hotel_sources) = (
+                await asyncio.gather(
+                    self._resolve_city_attractions(
+                        city, country, days, target_attractions, attractions_result
+                    ),
+                    self._resolve_city_hotels(
+                        city, country, budget_level, hotels_result
+                    ),
+                )
+            )
+            city_sources = attraction_sources + hotel_sources
 
-            except Exception as e:
-                logger.error(f"Research error for {city}: {e}")
-                city_sources.append(f"Error researching {city}: {str(e)}")
-
-            return city_attractions, city_hotels, city_sources
-
-        # Run all city research in parallel
-        city_tasks = [research_city(alloc) for alloc in city_allocations if alloc.get("city")]
-        results = await asyncio.gather(*city_tasks)
-
-        for attractions, hotels, sources in results:
-            all_attractions.extend(attractions)
-            all_hotels.extend(hotels)
-            all_sources.extend(sources)
-
-        # Build final attractions list with enhanced data
-        final_attractions = []
-        for a in all_attractions:
-            attraction_dict = {
-                "name": a.name,
-                "city": a.city,
-                "description": a.description,
-                "category": a.category,
-                "estimated_duration_hours": a.estimated_duration_hours,
-                "address": a.address,
-                "opening_hours": a.opening_hours,
-                "entrance_fee_usd": a.entrance_fee_usd,
-                "booking_required": a.booking_required,
-                "tips": a.tips,
-                "source_url": a.source_url,
-            }
+        except Exception as e:
+            logger.error(f"Research error for {city}: {e}")
+            city_sources.append(f"Error researching {city}: {str(e)}")
 
-            # Add enhanced data if available from Places API
-            if hasattr(a, "rating") and a.rating:
-                attraction_dict["rating"] = a.rating
-            if hasattr(a, "review_count") and a.review_count:
-                attraction_dict["review_count"] = a.review_count
-            if hasattr(a, "photo_urls") and a.photo_urls:
-                attraction_dict["photo_urls"] = a.photo_urls
-            if hasattr(a, "google_maps_url") and a.google_maps_url:
-                attraction_dict["google_maps_url"] = a.google_maps_url
-            if hasattr(a, "website") and a.website:
-                attraction_dict["website"] = a.website
-            if hasattr(a, "phone") and a.phone:
-                attraction_dict["phone"] = a.phone
-            if hasattr(a, "review_highlights") and a.review_highlights:
-                attraction_dict["review_highlights"] = a.review_highlights
-
-            final_attractions.append(attraction_dict)
+        return city_attractions, city_hotels, city_sources
 
-        return {
-            "attractions": final_attractions,
-            "hotels": all_hotels,
-            "research_sources": all_sources,
-        }
+    async def _resolve_city_attractions(
+        self,
+        city: str,
+        country: str,
+        days: int,
+        target_attractions: int,
+        attractions_result: str | BaseException,
+    ) -> tuple[list[Attraction], list[str]]:
+        """Turn a Places API attractions response into attractions for a city.
+
+        Args:
+            city: City name.
+            country: Country name.
+            days: Number of days in this city.
+            target_attractions: Number of attractions wanted.
+            attractions_result: Places API tool output, or the exception it raised.
+
+        Returns:
+            Tuple of (attractions, sources).
+        """
+        city_attractions = []
+        city_sources = []
+
+        api_failed = False
+        if not isinstance(attractions_result, BaseException):
+            places_data = orjson.loads(attractions_result)
+            if not places_data.get("error"):
+                # Duplicates would take up slots in the target count and
+                # prompt tokens in structuring
+                places_api_data = _dedupe_by_name(places_data.get("attractions", []))
+                city_sources.append(f"Google Places API: {city} attractions")
+                logger.info(f"Found {len(places_api_data)} attractions in {city}")
+
+                # Complete Places API results map straight onto Attraction;
+                # only fall back to LLM structuring when fields are missing.
+                # Structuring only extracts from these results, so it can't
+                # make up for a short list either
+                city_attractions = self._attractions_from_places(
+                    city, places_api_data, target_attractions
+                )
+                if places_api_data and not city_attractions:
+                    try:
+                        structured = await self._structure_attractions(
+                            city=city,
+                            country=country,
+                            places_api_data=places_api_data,
+                            days=days,
+                        )
+                        city_attractions = list(structured.attractions_found)
+                        city_sources.extend(structured.sources_browsed)
+                    except Exception as e:
+                        # Don't lose the Places data (or retry the LLM) over
+                        # a failed structuring call
+                        logger.warning(
+                            f"LLM structuring failed for {city}, using Places data as-is: {e}"
+                        )
+                        city_attractions = self._attractions_from_places(
+                            city, places_api_data, target_attractions, require_complete=False
+                        )
+            else:
+                logger.warning(f"Attractions API error for {city}: {places_data.get('error')}")
+                api_failed = True
+        else:
+            logger.error(f"Attractions exception for {city}: {attractions_result}")
+            api_failed = True
+
+        # FALLBACK: Generate attractions using LLM if API failed
+        if api_failed or not city_attractions:
+            logger.info(f"Using LLM fallback for {city} attractions...")
+            fallback_attractions = await self._generate_fallback_attractions(
+                city=city,
+                country=country,
+                days=days,
+            )
+            if fallback_attractions:
+                city_attractions = fallback_attractions
+                city_sources.append(f"LLM Knowledge Base: {city} attractions (API unavailable)")
+
+        return city_attractions, city_sources
+
+    async def _resolve_city_hotels(
+        self,
+        city: str,
+        country: str,
+        budget_level: str,
+        hotels_result: str | BaseException,
+    ) -> tuple[list[dict], list[str]]:
+        """Turn a Places API hotels response into hotels for a city.
+
+        Args:
+            city: City name.
+            country: Country name.
+            budget_level: Trip budget level.
+            hotels_result: Places API tool output, or the exception it raised.
+
+        Returns:
+            Tuple of (hotels, sources).
+        """
+        city_hotels = []
+        city_sources = []
+
+        hotels_api_failed = False
+        if not isinstance(hotels_result, BaseException):
+            hotels_data = orjson.loads(hotels_result)
+            if not hotels_data.get("error"):
+                city_hotels = hotels_data.get("hotels", [])
+                city_sources.append(f"Google Places API: {city} hotels")
+                logger.info(f"Found {len(city_hotels)} hotels in {city}")
+            else:
+                logger.warning(f"Hotels API error for {city}: {hotels_data.get('error')}")
+                hotels_api_failed = True
+        else:
+            logger.error(f"Hotels exception for {city}: {hotels_result}")
+            hotels_api_failed = True
+
+        # FALLBACK: Generate hotels using LLM if API failed
+        if hotels_api_failed or not city_hotels:
+            logger.info(f"Using LLM fallback for {city} hotels...")
+            fallback_hotels = await self._generate_fallback_hotels(
+                city=city,
+                country=country,
+                budget_level=budget_level,
+            )
+            if fallback_hotels:
+                city_hotels = fallback_hotels
+                city_sources.append(f"LLM Knowledge Base: {city} hotels (API unavailable)")
+
+        return city_hotels, city_sources
 
     async def _structure_attractions(
         self,
         city: str,
         country: str,
-        raw_data: list[dict],
+        places_api_data: list[dict],
         days: int,
-        places_api_data: list[dict] | None = None,
     ) -> ResearchOutput:
-        """Use LLM to structure raw search results into proper attractions.
+        """Use LLM to structure Places API results into proper attractions.
 
         Args:
             city: City name.
             country: Country name.
-            raw_data: Raw search result data.
-            days: Number of days in this city (for context).
             places_api_data: Data from Google Places API with photos and ratings.
+            days: Number of days in this city (for context).
 
         Returns:
             Structured ResearchOutput with attractions.
         """
-        # Build enhanced data section if we have Places API data
-        places_section = ""
-        if places_api_data:
-            places_section = "\n\nDETAILED DATA FROM GOOGLE PLACES API (use this as primary source):\n"
-            for p in places_api_data[:15]:
-                places_section += f"\n- {p.get('name')}"
-                if p.get("rating"):
-                    places_section += f" ★{p.get('rating')}"
-                if p.get("review_count"):
-                    places_section += f" ({p.get('review_count'):,} reviews)"
-                places_section += f"\n  Category: {p.get('category', 'unknown')}"
-                if p.get("address"):
-                    places_section += f"\n  Address: {p.get('address')}"
-                if p.get("opening_hours"):
-                    hours = p.get("opening_hours")
-                    if isinstance(hours, list):
-                        places_section += f"\n  Hours: {hours[0] if hours else 'N/A'}..."
-                if p.get("website"):
-                    places_section += f"\n  Website: {p.get('website')}"
-                if p.get("photo_urls"):
-                    places_section += f"\n  Photos available: {len(p.get('photo_urls', []))} images"
-                if p.get("review_highlights"):
-                    highlights = p.get("review_highlights", [])
-                    if highlights:
-                        preview = highlights[0].get("text", "")[:100] if isinstance(highlights[0], dict) else str(highlights[0])[:100]
-                        places_section += f'\n  Review: "{preview}..."'
-
-        human_content = f"""Process these search results for {city}, {country} into structured attraction data.
+        places_section = self._build_places_section(places_api_data)
 
-The traveler will spend {days} days in {city}.
-{places_section}
-Raw search results:
-{json.dumps(raw_data[:20], indent=2)}
-
-Please:
-1. Extract valid attractions from these results
-2. PRIORITIZE attractions from the Google Places API data (they have ratings, reviews, and photos)
-3. Remove duplicates and irrelevant entries
-4. Assign appropriate categories (landmark, museum, temple, nature, market, etc.)
-5. Estimate realistic visit durations
-6. Note any information about booking requirements
-7. Include the rating and review_count in your output when available
-8. Preserve photo_urls, google_maps_url, website, and phone from the Places API data
-
-Return structured attraction data for these results.
-"""
+        human_content = RESEARCH_HUMAN_TEMPLATE.format(
+            city=city,
+            country=country,
+            days=days,
+            places_section=places_section,
+        )
 
         structured_llm = self.get_structured_llm(ResearchOutput)
 
         messages = [
-            SystemMessage(content=RESEARCH_SYSTEM_PROMPT),
+            RESEARCH_SYSTEM_MESSAGE,
             HumanMessage(content=human_content),
         ]
 
         result = await structured_llm.ainvoke(messages)
 
         # Enrich the structured results with Places API data
-        if places_api_data:
-            result = self._enrich_with_places_data(result, places_api_data)
+        result = self._enrich_with_places_data(result, places_api_data)
 
         return result
 
+    def _attractions_from_places(
+        self,
+        city: str,
+        places_data: list[dict],
+        target_count: int,
+        require_complete: bool = True,
+    ) -> list[Attraction]:
+        """Build attractions directly from Places API results.
+
+        Args:
+            city: City name.
+            places_data: Raw data from Google Places API.
+            target_count: Number of attractions wanted for this city.
+            require_complete: If True, give up unless every result has all
+                required fields (placeholder names and categories count as
+                missing). If False, build what is available, skipping unnamed
+                results and defaulting the category.
+
+        Returns:
+            Up to target_count attractions, or an empty list if any result
+            lacks a required field and require_complete is set.
+        """
+        places = places_data[:target_count]
+        if require_complete:
+            if not all(
+                _places_value(p, field) for p in places for field in _REQUIRED_PLACES_FIELDS
+            ):
+                return []
+        else:
+            places = [p for p in places if _places_value(p, "name")]
+
+        attractions = []
+        for p in places:
+            category = p.get("category") or "attraction"
+            hours = p.get("opening_hours")
+            highlights = p.get("review_highlights") or []
+            attractions.append(Attraction(
+                name=p["name"],
+                city=city,
+                description=p.get("editorial_summary") or None,
+                category=category,
+                estimated_duration_hours=ATTRACTION_DURATION_HOURS.get(
+                    category, DEFAULT_ATTRACTION_DURATION_HOURS
+                ),
+                address=p.get("address") or None,
+                opening_hours="; ".join(hours) if isinstance(hours, list) else hours or None,
+                rating=p.get("rating"),
+                review_count=p.get("review_count"),
+                photo_urls=p.get("photo_urls") or [],
+                google_maps_url=p.get("google_maps_url"),
+                website=p.get("website"),
+                phone=p.get("phone"),
+                review_highlights=[
+                    h.get("text", "") if isinstance(h, dict) else str(h)
+                    for h in highlights[:5]
+                ],
+            ))
+        return attractions
+
+    def _build_places_section(self, places_api_data: list[dict] | None) -> str:
+        """Build the Places API data section for the structuring prompt.
+
+        Args:
+            places_api_data: Data from Google Places API.
+
+        Returns:
+            Formatted string with place details.
+        """
+        if not places_api_data:
+            return ""
+
+        parts = ["\n\nDETAILED DATA FROM GOOGLE PLACES API (use this as primary source):\n"]
+        for p in places_api_data[:15]:
+            parts.append(f"\n- {p.get('name')}")
+            if p.get("rating"):
+                parts.append(f" ★{p.get('rating')}")
+            if p.get("review_count"):
+                parts.append(f" ({p.get('review_count'):,} reviews)")
+            parts.append(f"\n  Category: {p.get('category', 'unknown')}")
+            if p.get("address"):
+                parts.append(f"\n  Address: {p.get('address')}")
+            hours = p.get("opening_hours")
+            if hours and isinstance(hours, list):
+                parts.append(f"\n  Hours: {hours[0]}...")
+            if p.get("website"):
+                parts.append(f"\n  Website: {p.get('website')}")
+            if p.get("photo_urls"):
+                parts.append(f"\n  Photos available: {len(p['photo_urls'])} images")
+            highlights = p.get("review_highlights")
+            if highlights:
+                first = highlights[0]
+                preview = first.get("text", "")[:100] if isinstance(first, dict) else str(first)[:100]
+                parts.append(f'\n  Review: "{preview}..."')
+
+        return "".join(parts)
+
     def _enrich_with_places_data(
         self,
         result: ResearchOutput,
@@ -340,46 +641,43 @@ Return structured attraction data for these results.
         Returns:
             Enriched ResearchOutput with photos and ratings.
         """
-        # Create lookup by name
-        places_lookup = {}
-        for p in places_data:
-            name_lower = p.get("name", "").lower().strip()
-            places_lookup[name_lower] = p
+        # Create lookup by normalized name
+        places_lookup = {_normalize_name(p.get("name") or ""): p for p in places_data}
+        places_names = list(places_lookup)
 
         # Enrich each attraction
-        for attraction in result.attractions_found:
-            name_lower = attraction.name.lower().strip()
+        for i, attraction in enumerate(result.attractions_found):
+            name_key = _normalize_name(attraction.name)
 
             # Try exact match first
-            places_match = places_lookup.get(name_lower)
+            places_match = places_lookup.get(name_key)
 
-            # Try partial match
+            # Fall back to word-order-insensitive fuzzy matching; one name's
+            # words being a subset of the other's scores 100
             if not places_match:
-                for places_name, places_info in places_lookup.items():
-                    if name_lower in places_name or places_name in name_lower:
-                        places_match = places_info
-                        break
+                match = process.extractOne(
+                    name_key,
+                    places_names,
+                    scorer=fuzz.token_set_ratio,
+                    score_cutoff=RESEARCH_MATCH_SCORE_CUTOFF,
+                )
+                if match is not None:
+                    places_match = places_lookup[match[0]]
 
             if places_match:
-                # Set rating and review count
-                if places_match.get("rating"):
-                    attraction.rating = places_match["rating"]
-                if places_match.get("review_count"):
-                    attraction.review_count = places_match["review_count"]
-                if places_match.get("photo_urls"):
-                    attraction.photo_urls = places_match["photo_urls"]
-                if places_match.get("google_maps_url"):
-                    attraction.google_maps_url = places_match["google_maps_url"]
-                if places_match.get("website"):
-                    attraction.website = places_match["website"]
-                if places_match.get("phone"):
-                    attraction.phone = places_match["phone"]
-                if places_match.get("review_highlights"):
-                    highlights = places_match["review_highlights"]
-                    attraction.review_highlights = [
+                updates = {
+                    field: places_match[field]
+                    for field in _PLACES_COPY_FIELDS
+                    if places_match.get(field)
+                }
+                highlights = places_match.get("review_highlights")
+                if highlights:
+                    updates["review_highlights"] = [
                         h.get("text", "") if isinstance(h, dict) else str(h)
                         for h in highlights[:5]
                     ]
+                if updates:
+                    result.attractions_found[i] = attraction.model_copy(update=updates)
 
         return result
 
@@ -418,48 +716,27 @@ Include a mix of:
 - Nature spots or parks
 - Hidden gems popular with locals
 
-Return valid JSON array of attractions."""
+Return the attractions in the structured format requested."""
 
         messages = [
-            SystemMessage(content="You are a travel expert with extensive knowledge of tourist destinations worldwide. Generate accurate, real attraction data."),
+            FALLBACK_ATTRACTIONS_SYSTEM_MESSAGE,
             HumanMessage(content=prompt),
         ]
 
         try:
-            response = await self.llm.ainvoke(messages)
-            content = response.content
-
-            # Extract JSON from response
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            attractions_data = json.loads(content)
+            structured_llm = self.get_structured_llm(FallbackAttractionList)
+            response = await structured_llm.ainvoke(messages)
 
             # Convert to Attraction objects
-            attractions = []
-            for a in attractions_data:
-                try:
-                    attraction = Attraction(
-                        name=a.get("name", "Unknown"),
-                        city=city,
-                        description=a.get("description", ""),
-                        category=a.get("category", "attraction"),
-                        estimated_duration_hours=float(a.get("estimated_duration_hours", 2)),
-                        address=a.get("address"),
-                        opening_hours=a.get("opening_hours"),
-                        entrance_fee_usd=float(a.get("entrance_fee_usd", 0)) if a.get("entrance_fee_usd") else None,
-                        booking_required=a.get("booking_required", False),
-                        tips=a.get("tips"),
-                        source_url=None,
-                        rating=a.get("rating", 4.2),  # Default reasonable rating
-                        review_count=a.get("review_count"),
-                    )
-                    attractions.append(attraction)
-                except Exception as e:
-                    logger.warning(f"Failed to parse fallback attraction: {e}")
-                    continue
+            attractions = [
+                Attraction(
+                    **a.model_dump(exclude={"entrance_fee_usd", "rating"}),
+                    city=city,
+                    entrance_fee_usd=a.entrance_fee_usd or None,
+                    rating=a.rating if a.rating is not None else 4.2,  # Default reasonable rating
+                )
+                for a in response.attractions
+            ]
 
             logger.info(f"Generated {len(attractions)} fallback attractions for {city}")
             return attractions
@@ -498,40 +775,31 @@ For each hotel, provide:
 - price_level: One of (budget, moderate, expensive, luxury)
 - review_highlights: Array of 2-3 typical positive review snippets
 
-Include well-known hotel chains and popular local hotels.
-Return valid JSON array."""
+Include well-known hotel chains and popular local hotels."""
 
         messages = [
-            SystemMessage(content="You are a travel expert with knowledge of hotels worldwide. Generate accurate, real hotel data."),
+            FALLBACK_HOTELS_SYSTEM_MESSAGE,
             HumanMessage(content=prompt),
         ]
 
         try:
-            response = await self.llm.ainvoke(messages)
-            content = response.content
-
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            hotels_data = json.loads(content)
+            structured_llm = self.get_structured_llm(FallbackHotelList)
+            response = await structured_llm.ainvoke(messages)
 
             # Normalize hotel data
-            hotels = []
-            for h in hotels_data:
-                hotel = {
-                    "name": h.get("name", "Unknown Hotel"),
+            hotels = [
+                {
+                    "name": h.name,
                     "city": city,
-                    "address": h.get("address", ""),
-                    "rating": h.get("rating", 4.0),
-                    "review_count": h.get("review_count", 500),
-                    "price_level": h.get("price_level", "moderate"),
+                    "address": h.address,
+                    "rating": h.rating,
+                    "review_count": h.review_count,
+                    "price_level": h.price_level,
                     "source": "llm_fallback",
-                    "review_highlights": h.get("review_highlights", []),
+                    "review_highlights": h.review_highlights,
                 }
-                hotels.append(hotel)
+                for h in response.hotels
+            ]
 
             logger.info(f"Generated {len(hotels)} fallback hotels for {city}")
             return hotels
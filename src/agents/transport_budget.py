@@ -1,5 +1,6 @@
 """Transport/Budget Agent - Calculates transport options and budget breakdown."""
 
+from collections import Counter
 from typing import Any, Optional
 
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -60,6 +61,64 @@ When real prices are provided from scraped booking sites:
 - Always show both real price (if available) and your estimate for comparison
 """
 
+TRANSPORT_BUDGET_SYSTEM_MESSAGE = SystemMessage(content=TRANSPORT_BUDGET_SYSTEM_PROMPT)
+
+# Trip request; filled with str.format so the prompt text lives in one place
+TRANSPORT_BUDGET_HUMAN_TEMPLATE = """Calculate transport options and budget for this trip:
+
+TRIP OVERVIEW:
+- Total days: {total_days}
+- Budget level: {budget_level}
+{origin_line}{dates_section}
+
+CITIES:
+{cities_info}
+{origin_section}
+INTER-CITY ROUTES:
+{routes_info}
+{real_prices_section}
+ATTRACTIONS:
+{attractions_summary}
+
+Please provide:
+{requested_items}
+
+NOTE: When real prices are provided above, USE THEM as primary cost reference. Include cheaper date alternatives if available.
+"""
+
+ORIGIN_SECTION_TEMPLATE = """
+ORIGIN TO DESTINATION (IMPORTANT - Include this as the first transport segment):
+- Traveler starts from: {origin_city}
+- First destination: {city}, {country}
+- Please provide flight/train options with:
+  * Recommended option (mode, duration, cost estimate)
+  * 2-3 alternatives
+  * Booking tips (best platforms, when to book)
+  * Departure timing suggestions
+"""
+
+_REQUESTED_ITEMS = (
+    "Detailed transport options for each inter-city segment (2-3 options each)",
+    "Local transport recommendations for each city",
+    "Complete budget breakdown (include origin transport if applicable)",
+    "Money-saving tips specific to these destinations",
+)
+
+# Numbered request lists, with and without the origin-to-first-city leg
+_NUMBERED_REQUESTS = "\n".join(
+    f"{i}. {item}" for i, item in enumerate(_REQUESTED_ITEMS, start=1)
+)
+_NUMBERED_REQUESTS_WITH_ORIGIN = "\n".join(
+    f"{i}. {item}"
+    for i, item in enumerate(
+        (
+            "Origin-to-first-city transport options (flights/trains) with costs and timings",
+            *_REQUESTED_ITEMS,
+        ),
+        start=1,
+    )
+)
+
 
 class TransportBudgetAgent(BaseAgent):
     """Transport/Budget Agent for logistics and cost estimation.
@@ -74,6 +133,7 @@ class TransportBudgetAgent(BaseAgent):
     """
 
     agent_name = "transport_budget"
+    output_schemas = (TransportBudgetOutput,)
 
     def __init__(self, **kwargs):
         kwargs.setdefault("temperature", TRANSPORT_TEMPERATURE)
@@ -108,7 +168,7 @@ class TransportBudgetAgent(BaseAgent):
         origin_city = state.get("origin_city")
 
         # Sort cities by visit order
-        sorted_cities = sorted(city_allocations, key=lambda x: x.get("visit_order", 0))
+        sorted_cities = self._sorted_allocations(city_allocations)
         first_city = sorted_cities[0] if sorted_cities else None
 
         # Build context for the LLM
@@ -126,25 +186,17 @@ class TransportBudgetAgent(BaseAgent):
         attractions_summary = f"{len(attractions)} attractions planned"
         if attractions:
             # Count attractions per city
-            by_city = {}
-            for a in attractions:
-                city = a.get("city", "Unknown")
-                by_city[city] = by_city.get(city, 0) + 1
+            by_city = Counter(a.get("city", "Unknown") for a in attractions)
             attractions_summary += " (" + ", ".join(f"{c}: {n}" for c, n in by_city.items()) + ")"
 
         # Build origin-to-destination section if origin is specified
         origin_section = ""
         if origin_city and first_city:
-            origin_section = f"""
-ORIGIN TO DESTINATION (IMPORTANT - Include this as the first transport segment):
-- Traveler starts from: {origin_city}
-- First destination: {first_city['city']}, {first_city['country']}
-- Please provide flight/train options with:
-  * Recommended option (mode, duration, cost estimate)
-  * 2-3 alternatives
-  * Booking tips (best platforms, when to book)
-  * Departure timing suggestions
-"""
+            origin_section = ORIGIN_SECTION_TEMPLATE.format(
+                origin_city=origin_city,
+                city=first_city["city"],
+                country=first_city["country"],
+            )
 
         # Build real-time prices section from scraped data
         real_prices_section = self._build_real_prices_section(
@@ -158,36 +210,23 @@ ORIGIN TO DESTINATION (IMPORTANT - Include this as the first transport segment):
             if travel_end_date:
                 dates_section += f" to {travel_end_date}"
 
-        human_content = f"""Calculate transport options and budget for this trip:
-
-TRIP OVERVIEW:
-- Total days: {total_days}
-- Budget level: {budget_level}
-{f"- Origin city: {origin_city}" if origin_city else ""}{dates_section}
-
-CITIES:
-{cities_info}
-{origin_section}
-INTER-CITY ROUTES:
-{routes_info}
-{real_prices_section}
-ATTRACTIONS:
-{attractions_summary}
-
-Please provide:
-1. {"Origin-to-first-city transport options (flights/trains) with costs and timings" if origin_city else ""}
-{"2." if origin_city else "1."} Detailed transport options for each inter-city segment (2-3 options each)
-{"3." if origin_city else "2."} Local transport recommendations for each city
-{"4." if origin_city else "3."} Complete budget breakdown (include origin transport if applicable)
-{"5." if origin_city else "4."} Money-saving tips specific to these destinations
-
-NOTE: When real prices are provided above, USE THEM as primary cost reference. Include cheaper date alternatives if available.
-"""
+        human_content = TRANSPORT_BUDGET_HUMAN_TEMPLATE.format(
+            total_days=total_days,
+            budget_level=budget_level,
+            origin_line=f"- Origin city: {origin_city}" if origin_city else "",
+            dates_section=dates_section,
+            cities_info=cities_info,
+            origin_section=origin_section,
+            routes_info=routes_info,
+            real_prices_section=real_prices_section,
+            attractions_summary=attractions_summary,
+            requested_items=_NUMBERED_REQUESTS_WITH_ORIGIN if origin_city else _NUMBERED_REQUESTS,
+        )
 
         structured_llm = self.get_structured_llm(TransportBudgetOutput)
 
         messages = [
-            SystemMessage(content=TRANSPORT_BUDGET_SYSTEM_PROMPT),
+            TRANSPORT_BUDGET_SYSTEM_MESSAGE,
             HumanMessage(content=human_content),
         ]
 
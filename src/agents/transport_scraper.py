@@ -1,9 +1,12 @@
 """Transport Scraper Agent - Fetches real prices before budget estimation."""
 
-import json
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+import orjson
+
+from src.config.constants import TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS
 from src.models.state import AgentState
 from src.models.transport_price import PriceSource
 from src.tools.browser.transport_scrapers import (
@@ -69,30 +72,37 @@ class TransportScraperAgent:
         scraped_prices = []
         nearest_stations = {}
 
+        # Sort cities by visit order once for dates and the origin leg
+        sorted_cities = sorted(city_allocations, key=lambda x: x.get("visit_order", 0))
+
         # Calculate travel date for each segment
         segment_dates = self._calculate_segment_dates(
-            city_allocations, travel_start_date
+            sorted_cities, travel_start_date
         )
 
+        # Segment scrapes and station lookups run concurrently, bounded so
+        # long trips don't open a browser session per segment at once
+        semaphore = asyncio.Semaphore(TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS)
+
         # If we have an origin city, scrape origin -> first destination
-        if origin_city and city_allocations:
-            sorted_cities = sorted(city_allocations, key=lambda x: x.get("visit_order", 0))
-            if sorted_cities:
-                first_city = sorted_cities[0]
-                first_destination = first_city.get("city")
-                first_country = first_city.get("country", "")
-
-                if first_destination:
-                    origin_prices = await self._scrape_segment(
-                        from_city=origin_city,
-                        to_city=first_destination,
-                        country=first_country,
-                        travel_date=travel_start_date,
-                        is_international=self._is_international(origin_city, first_country),
-                    )
-                    scraped_prices.extend(origin_prices)
+        origin_task = None
+        if origin_city and sorted_cities:
+            first_city = sorted_cities[0]
+            first_destination = first_city.get("city")
+            first_country = first_city.get("country", "")
+
+            if first_destination:
+                origin_task = self._scrape_segment(
+                    from_city=origin_city,
+                    to_city=first_destination,
+                    country=first_country,
+                    travel_date=travel_start_date,
+                    semaphore=semaphore,
+                    is_international=self._is_international(origin_city, first_country),
+                )
 
-        # Scrape each route segment
+        # Prepare each route segment
+        segment_jobs = []
         for segment in route_segments:
             from_city = segment.get("from_city")
             to_city = segment.get("to_city")
@@ -106,22 +116,46 @@ class TransportScraperAgent:
             # Determine travel date for this segment
             segment_date = segment_dates.get(from_city, travel_start_date)
 
-            segment_prices = await self._scrape_segment(
-                from_city=from_city,
-                to_city=to_city,
-                country=country,
-                travel_date=segment_date,
-                recommended_mode=segment.get("recommended_transport"),
-            )
-            scraped_prices.extend(segment_prices)
+            segment_jobs.append((
+                from_city,
+                to_city,
+                country,
+                self._scrape_segment(
+                    from_city=from_city,
+                    to_city=to_city,
+                    country=country,
+                    travel_date=segment_date,
+                    semaphore=semaphore,
+                    recommended_mode=segment.get("recommended_transport"),
+                ),
+            ))
+
+        # Segments are independent - scrape them all concurrently
+        tasks = [job[3] for job in segment_jobs]
+        if origin_task is not None:
+            tasks.insert(0, origin_task)
+        results = await asyncio.gather(*tasks)
+
+        if origin_task is not None:
+            scraped_prices.extend(results[0])
+            results = results[1:]
 
-            # Check for nearest stations if no results found
+        # Check for nearest stations where a segment returned no results
+        station_lookups: dict[str, str] = {}
+        for (from_city, to_city, country, _), segment_prices in zip(segment_jobs, results):
+            scraped_prices.extend(segment_prices)
             if not segment_prices:
                 for city in [from_city, to_city]:
-                    if city.lower() not in nearest_stations:
-                        station_info = await self._find_stations(city, country)
-                        if station_info:
-                            nearest_stations[city] = station_info
+                    station_lookups.setdefault(city, country)
+
+        if station_lookups:
+            station_results = await asyncio.gather(*(
+                self._find_stations(city, country, semaphore)
+                for city, country in station_lookups.items()
+            ))
+            for city, station_info in zip(station_lookups, station_results):
+                if station_info:
+                    nearest_stations[city] = station_info
 
         return {
             "scraped_transport_prices": scraped_prices,
@@ -134,6 +168,7 @@ class TransportScraperAgent:
         to_city: str,
         country: str,
         travel_date: Optional[str],
+        semaphore: asyncio.Semaphore,
         recommended_mode: Optional[str] = None,
         is_international: bool = False,
     ) -> list[dict]:
@@ -150,23 +185,24 @@ class TransportScraperAgent:
             from_city, to_city, country, recommended_mode, is_international
         )
 
-        for scraper_name, scraper_func, kwargs in scrapers_to_use:
-            try:
-                raw_result = await scraper_func.ainvoke(kwargs)
-                parsed = json.loads(raw_result)
+        async with semaphore:
+            for scraper_name, scraper_func, kwargs in scrapers_to_use:
+                try:
+                    raw_result = await scraper_func.ainvoke(kwargs)
+                    parsed = orjson.loads(raw_result)
 
-                if parsed.get("error"):
-                    continue
+                    if parsed.get("error"):
+                        continue
 
-                # Normalize results to common format
-                normalized = self._normalize_scrape_result(
-                    scraper_name, parsed, from_city, to_city, travel_date
-                )
-                results.extend(normalized)
+                    # Normalize results to common format
+                    normalized = self._normalize_scrape_result(
+                        scraper_name, parsed, from_city, to_city, travel_date
+                    )
+                    results.extend(normalized)
 
-            except Exception:
-                # Log but continue with other scrapers
-                continue
+                except Exception:
+                    # Log but continue with other scrapers
+                    continue
 
         return results
 
@@ -345,28 +381,38 @@ class TransportScraperAgent:
 
         return normalized
 
-    async def _find_stations(self, city: str, country: str) -> Optional[dict]:
+    async def _find_stations(
+        self, city: str, country: str, semaphore: asyncio.Semaphore
+    ) -> Optional[dict]:
         """Find nearest stations for a city."""
         try:
-            result = await find_nearest_stations.ainvoke({
-                "city": city,
-                "country": country,
-            })
-            return json.loads(result)
+            async with semaphore:
+                result = await find_nearest_stations.ainvoke({
+                    "city": city,
+                    "country": country,
+                })
+            return orjson.loads(result)
         except Exception:
             return None
 
     def _calculate_segment_dates(
         self,
-        city_allocations: list[dict],
+        sorted_cities: list[dict],
         start_date: Optional[str],
     ) -> dict[str, str]:
-        """Calculate travel date for each segment based on city days."""
-        if not start_date or not city_allocations:
+        """Calculate travel date for each segment based on city days.
+
+        Args:
+            sorted_cities: City allocations already sorted by visit order.
+            start_date: ISO trip start date.
+
+        Returns:
+            Mapping of city name to its arrival date.
+        """
+        if not start_date or not sorted_cities:
             return {}
 
         dates = {}
-        sorted_cities = sorted(city_allocations, key=lambda x: x.get("visit_order", 0))
 
         try:
             current_date = datetime.fromisoformat(start_date)
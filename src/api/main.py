@@ -14,11 +14,13 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 
+from src.agents.base import close_http_async_client
 from src.config.settings import get_settings
 from src.config.constants import MAX_GRAPH_ITERATIONS
 from src.graph.workflow import create_travel_graph, plan_trip
 from src.models.state import get_initial_state
 from src.tools.browser.browser_manager import BrowserManager
+from src.tools.google_api import close_http_client
 from src.cache.browser_cache import BrowserCache
 
 logger = logging.getLogger(__name__)
@@ -128,6 +130,8 @@ manager = ConnectionManager()
 async def lifespan(app: FastAPI):
     yield
     await BrowserManager.shutdown()
+    await close_http_client()
+    await close_http_async_client()
     BrowserCache.reset_instance()
 
 
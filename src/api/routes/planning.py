@@ -1,9 +1,9 @@
 """Planning routes with SSE streaming support."""
 
-import json
 import uuid
 from typing import AsyncGenerator
 
+import orjson
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
@@ -15,6 +15,11 @@ from src.models.state import get_initial_state
 router = APIRouter(prefix="/plan", tags=["planning"])
 
 
+def _sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {orjson.dumps(data, default=str).decode()}\n\n"
+
+
 class StreamPlanRequest(BaseModel):
     """Request model for streaming planning."""
 
@@ -85,7 +90,7 @@ async def stream_planning_events(
 
             if event_type == "on_chain_start":
                 # Agent starting
-                yield f"event: agent_start\ndata: {json.dumps({'agent': event_name})}\n\n"
+                yield _sse_event("agent_start", {"agent": event_name})
 
             elif event_type == "on_chain_end":
                 # Agent completed
@@ -110,20 +115,20 @@ async def stream_planning_events(
                     itinerary = output.get("final_itinerary", {})
                     summary["title"] = itinerary.get("trip_title", "")
 
-                yield f"event: agent_complete\ndata: {json.dumps({'agent': event_name, 'summary': summary})}\n\n"
+                yield _sse_event("agent_complete", {"agent": event_name, "summary": summary})
 
             elif event_type == "on_chain_error":
                 error_msg = str(event.get("data", {}).get("error", "Unknown error"))
-                yield f"event: error\ndata: {json.dumps({'error': error_msg})}\n\n"
+                yield _sse_event("error", {"error": error_msg})
 
         # Get final result
         final_state = await graph.aget_state(config)
         itinerary = final_state.values.get("final_itinerary") if final_state.values else None
 
-        yield f"event: complete\ndata: {json.dumps({'success': itinerary is not None, 'thread_id': thread_id})}\n\n"
+        yield _sse_event("complete", {"success": itinerary is not None, "thread_id": thread_id})
 
     except Exception as e:
-        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        yield _sse_event("error", {"error": str(e)})
 
 
 @router.post("/stream")
@@ -0,0 +1,96 @@
+"""In-process LRU cache with optional TTL for agent results."""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generic, Hashable, Optional, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class MemoryCache(Generic[K, V]):
+    """Process-wide LRU cache shared by agents across graph runs.
+
+    Entries expire after ttl_seconds (if set) and the least recently used
+    entry is evicted beyond max_size. Values are deep-copied on the way in
+    and out, so callers can mutate results without touching the cache.
+    Per-key locks let concurrent requests for the same key compute it once.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept.
+            ttl_seconds: Entry lifetime in seconds. None keeps entries
+                until they are evicted.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._locks: dict[K, asyncio.Lock] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a copy of an unexpired value, refreshing its LRU position.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Copy of the cached value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: K, value: V) -> None:
+        """Store a copy of a value, evicting the oldest entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @asynccontextmanager
+    async def lock(self, key: K) -> AsyncIterator[None]:
+        """Hold the in-flight lock for a key.
+
+        Callers should check the cache again once the lock is held, since
+        another request may have filled it while they waited.
+
+        Args:
+            key: Cache key.
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                yield
+        finally:
+            if self._locks.get(key) is lock and not lock.locked():
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
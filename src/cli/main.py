@@ -14,11 +14,13 @@ from rich.table import Table
 from rich.markdown import Markdown
 from rich.prompt import Prompt
 
+from src.agents.base import close_http_async_client
 from src.config.constants import MAX_GRAPH_ITERATIONS
 from src.graph.workflow import create_travel_graph
 from src.models.state import get_initial_state
 from src.cache.browser_cache import BrowserCache
 from src.tools.browser.browser_manager import BrowserManager
+from src.tools.google_api import close_http_client
 
 app = typer.Typer(
     name="travel",
@@ -57,7 +59,7 @@ def plan(
     ))
 
     try:
-        result = asyncio.run(_run_planning(request, verbose))
+        result = asyncio.run(_plan_and_close_clients(request, verbose))
 
         if result.get("final_itinerary"):
             _display_itinerary(result["final_itinerary"])
@@ -84,6 +86,19 @@ def plan(
         asyncio.run(BrowserManager.shutdown())
 
 
+async def _plan_and_close_clients(request: str, verbose: bool) -> dict:
+    """Run the planning workflow, then close the shared HTTP clients.
+
+    The clients are bound to this event loop, so they are closed here rather
+    than from the separate loop used for browser cleanup.
+    """
+    try:
+        return await _run_planning(request, verbose)
+    finally:
+        await close_http_client()
+        await close_http_async_client()
+
+
 async def _run_planning(request: str, verbose: bool) -> dict:
     """Run the planning workflow with interactive clarification."""
     graph = create_travel_graph()
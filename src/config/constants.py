@@ -19,6 +19,24 @@ AGENT_MODELS = {
     "critic": "gpt4o",  # Critical validation
 }
 
+# LLM response cache (process-wide, shared by all agents)
+LLM_CACHE_MAX_SIZE = 256  # Max cached prompt/response pairs
+
+# Shared HTTP connection pool for OpenAI requests
+LLM_HTTP_MAX_CONNECTIONS = 128
+LLM_HTTP_MAX_KEEPALIVE = 64
+LLM_HTTP_TIMEOUT_SECONDS = 60.0
+
+# Shared HTTP connection pool for Google Places API requests
+PLACES_HTTP_MAX_CONNECTIONS = 20
+PLACES_HTTP_MAX_KEEPALIVE = 10
+PLACES_HTTP_TIMEOUT_SECONDS = 30.0
+
+# Per-city fan-out (bounds concurrent LLM/scraper calls to avoid rate limits)
+FOOD_CULTURE_MAX_CONCURRENT_CITIES = 5
+RESEARCH_MAX_CONCURRENT_CITIES = 5
+TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS = 4  # Segment scrapes/station lookups in flight
+
 # Browser settings
 BROWSER_TIMEOUT_MS = 30000
 PAGE_LOAD_WAIT = "networkidle"
@@ -33,6 +51,62 @@ USER_AGENT = (
 MAX_CONTENT_LENGTH = 10000  # Characters
 MAX_ATTRACTIONS_PER_CITY = 10
 MAX_RESTAURANTS_PER_CITY = 5
+CRITIC_ATTRACTIONS_PER_CITY = 5  # Attractions per city shown to the critic
+CRITIC_MAX_NAME_CHARS = 80  # Attraction names are shortened beyond this
+CRITIC_MAX_ISSUES = 10  # Issues kept in validation_result, most severe first
+CRITIC_MAX_FEEDBACK_ISSUES = 5  # Critical/high issues passed back to the planner
+PLANNER_CACHE_MAX_SIZE = 128  # Cached first-pass plans, keyed by normalized request
+REVIEW_CACHE_MAX_SIZE = 128  # Cached restaurant review lists, keyed by city
+REVIEW_CACHE_TTL_SECONDS = 3600  # Scraped reviews are reused for an hour
+FOOD_CULTURE_REVIEWS_IN_PROMPT = 15  # Top scraped restaurants shown to the LLM
+FOOD_CULTURE_REVIEWS_FOR_MATCHING = 25  # Top scraped restaurants tried for fuzzy name matches
+FOOD_CULTURE_MATCH_SCORE_CUTOFF = 60  # Min token-set similarity (0-100) for a fuzzy match
+FOOD_CULTURE_CACHE_MAX_SIZE = 256  # Cached per-city food/culture outputs
+RESEARCH_CACHE_MAX_SIZE = 128  # Cached per-city research results
+RESEARCH_CACHE_TTL_SECONDS = 86400  # Places results change over days, not minutes
+RESEARCH_MATCH_SCORE_CUTOFF = 80  # Min token-set similarity (0-100) to enrich from a Places result
+
+# Typical visit durations for attractions built directly from Places API data,
+# keyed by the category assigned from Google place types
+ATTRACTION_DURATION_HOURS = {
+    "museum": 2.5,
+    "religious_site": 1.0,
+    "nature": 2.0,
+    "entertainment": 3.0,
+    "shopping": 1.5,
+    "landmark": 1.5,
+    "food_drink": 1.0,
+}
+DEFAULT_ATTRACTION_DURATION_HOURS = 2.0
+
+# Cities the clarification agent accepts as specific destinations without
+# asking the LLM. Anything else (states, countries, regions, unlisted cities)
+# goes to the LLM, so a missing entry only costs a call
+KNOWN_DESTINATION_CITIES = frozenset({
+    # India
+    "delhi", "new delhi", "mumbai", "bangalore", "bengaluru", "chennai",
+    "kolkata", "hyderabad", "pune", "jaipur", "udaipur", "jodhpur", "jaisalmer",
+    "goa", "agra", "varanasi", "lucknow", "kochi", "trivandrum", "mysore",
+    "shimla", "manali", "rishikesh", "haridwar", "amritsar", "chandigarh",
+    "ahmedabad", "surat", "indore", "bhopal", "nagpur", "aurangabad", "nashik",
+    "coimbatore", "madurai", "thiruvananthapuram", "cochin", "ooty", "munnar",
+    "alleppey", "darjeeling", "gangtok", "leh", "srinagar", "guwahati",
+    "shillong", "pondicherry", "mahabalipuram", "rameswaram", "tirupati",
+    "shirdi", "mount abu", "pushkar", "khajuraho", "hampi", "gokarna", "varkala",
+    # Asia
+    "tokyo", "kyoto", "osaka", "seoul", "busan", "beijing", "shanghai",
+    "hong kong", "bangkok", "chiang mai", "phuket", "hanoi", "ho chi minh city",
+    "singapore", "kuala lumpur", "bali", "kathmandu", "colombo", "dubai",
+    "abu dhabi", "istanbul",
+    # Europe
+    "london", "paris", "rome", "florence", "venice", "milan", "barcelona",
+    "madrid", "lisbon", "amsterdam", "berlin", "munich", "prague", "vienna",
+    "budapest", "athens", "zurich", "edinburgh", "dublin",
+    # Americas and Oceania
+    "new york", "boston", "chicago", "san francisco", "los angeles",
+    "las vegas", "miami", "toronto", "vancouver", "mexico city", "sydney",
+    "melbourne",
+})
 
 # Graph settings
 MAX_GRAPH_ITERATIONS = 20  # Safety limit for the entire graph
@@ -33,10 +33,13 @@ def create_travel_graph(
     1. Planner: Understand request, allocate cities/days
     2. Geography: Validate and optimize route
     3. Research: Browse for attractions
-    4. Food/Culture: Get food recommendations
+    4. Food/Culture: Get food recommendations (runs in parallel with 2-3,
+       since it only needs the planner's city allocations)
     5. Transport Scraper: Fetch real-time transport prices (flights, trains, buses)
     6. Transport/Budget: Calculate transport and budget using scraped prices
-    7. Critic: Validate the complete plan
+       (5 runs in parallel with 3, since it only needs the validated route;
+       6 starts once that step finishes, so it sees the researched attractions)
+    7. Critic: Validate the complete plan once all branches finish
        - If issues found: Loop back to Planner with feedback
        - If approved: Finalize the itinerary
 
@@ -79,12 +82,15 @@ def create_travel_graph(
     workflow.add_edge("process_answers", "planner")
 
     # Add edges for the main flow
+    # Food/Culture runs alongside Geography; once the route is validated,
+    # Research and the Transport Scraper run side by side. The Critic waits
+    # for Research, Food/Culture and Transport/Budget to finish
     workflow.add_edge("planner", "geography")
+    workflow.add_edge("planner", "food_culture")
     workflow.add_edge("geography", "research")
-    workflow.add_edge("research", "food_culture")
-    workflow.add_edge("food_culture", "transport_scraper")
+    workflow.add_edge("geography", "transport_scraper")
     workflow.add_edge("transport_scraper", "transport_budget")
-    workflow.add_edge("transport_budget", "critic")
+    workflow.add_edge(["research", "food_culture", "transport_budget"], "critic")
 
     # Add conditional edge from critic
     # This is the feedback loop - critic decides if we need to replan
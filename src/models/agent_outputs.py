@@ -105,6 +105,51 @@ class ResearchOutput(BaseModel):
     sources_browsed: list[str] = Field(default_factory=list)
 
 
+class FallbackAttraction(BaseModel):
+    """An attraction generated from model knowledge when Places API is unavailable."""
+
+    name: str = Field(description="Exact real name of the attraction")
+    description: str = Field(description="2-3 sentence description")
+    category: str  # landmark, museum, temple, nature, market, palace, fort, etc.
+    estimated_duration_hours: float = 2.0
+    address: Optional[str] = None
+    entrance_fee_usd: Optional[float] = Field(
+        default=None,
+        description="Approximate fee in USD (0 if free)",
+    )
+    opening_hours: Optional[str] = None
+    tips: Optional[str] = None
+    booking_required: bool = False
+    rating: Optional[float] = Field(default=None, ge=0.0, le=5.0)
+    review_count: Optional[int] = Field(default=None, ge=0)
+
+
+class FallbackAttractionList(BaseModel):
+    """Attractions generated by the Research Agent's LLM fallback."""
+
+    attractions: list[FallbackAttraction]
+
+
+class FallbackHotel(BaseModel):
+    """A hotel generated from model knowledge when Places API is unavailable."""
+
+    name: str = Field(description="Exact real name of the hotel")
+    address: str = Field(default="", description="Approximate address or neighborhood")
+    rating: float = Field(default=4.0, ge=0.0, le=5.0)
+    review_count: int = Field(default=500, ge=0)
+    price_level: str = "moderate"  # budget, moderate, expensive, luxury
+    review_highlights: list[str] = Field(
+        default_factory=list,
+        description="2-3 typical positive review snippets",
+    )
+
+
+class FallbackHotelList(BaseModel):
+    """Hotels generated by the Research Agent's LLM fallback."""
+
+    hotels: list[FallbackHotel]
+
+
 # ============================================================================
 # Food/Culture Agent Output
 # ============================================================================
@@ -29,13 +29,24 @@ class BrowserManager:
     async def get_browser(cls) -> Browser:
         """Get or create the browser instance.
 
-        Thread-safe singleton pattern for browser creation.
+        Thread-safe singleton pattern for browser creation. Once the browser
+        is running, callers reuse it without waiting on the lock.
 
         Returns:
             Playwright Browser instance.
         """
+        browser = cls._browser
+        if browser is not None and browser.is_connected():
+            return browser
+
         async with cls._lock:
             if cls._browser is None or not cls._browser.is_connected():
+                # Stop the driver left behind by a crashed browser before relaunching
+                if cls._playwright is not None:
+                    try:
+                        await cls._playwright.stop()
+                    except Exception:
+                        pass
                 cls._playwright = await async_playwright().start()
                 cls._browser = await cls._playwright.chromium.launch(
                     headless=True,
@@ -2,15 +2,21 @@
 
 import asyncio
 import os
-import json
 import httpx
 import logging
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 from langchain_core.tools import tool
 
 from src.cache.browser_cache import BrowserCache
 from src.cache.transport_cache import RESTAURANT_REVIEW_CACHE_TTL
+from src.config.constants import (
+    PLACES_HTTP_MAX_CONNECTIONS,
+    PLACES_HTTP_MAX_KEEPALIVE,
+    PLACES_HTTP_TIMEOUT_SECONDS,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -36,6 +42,37 @@ ATTRACTION_CACHE_TTL = 604800  # 7 days for attractions
 PHOTO_CACHE_TTL = 604800  # 7 days for photos
 
 
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all Places API requests.
+
+    Reusing one pooled client keeps connections alive across cities and
+    tools instead of opening (and TLS-handshaking) a new one per search.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=PLACES_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=PLACES_HTTP_MAX_KEEPALIVE,
+        ),
+        timeout=PLACES_HTTP_TIMEOUT_SECONDS,
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared Places API HTTP client, if one was created.
+
+    Should be called when the application exits.
+    """
+    if _get_http_client.cache_info().currsize:
+        await _get_http_client().aclose()
+        _get_http_client.cache_clear()
+
+
+def _dumps(data: dict) -> str:
+    """Serialize a tool result; tool outputs must be strings."""
+    return orjson.dumps(data).decode()
+
+
 def _get_headers() -> dict:
     """Get headers for Places API (New) requests."""
     return {
@@ -299,7 +336,7 @@ async def search_restaurants_places_api(
         JSON with detailed restaurant data including ratings, reviews, photos, price levels.
     """
     if not GOOGLE_API_KEY:
-        return json.dumps({"error": "Google API key not configured", "restaurants": []})
+        return _dumps({"error": "Google API key not configured", "restaurants": []})
 
     cache = BrowserCache.get_instance()
     cache_key = f"places_restaurants_v2:{city}:{cuisine or 'all'}"
@@ -321,27 +358,27 @@ async def search_restaurants_places_api(
         query = f"best {cuisine + ' ' if cuisine else ''}restaurants in {city}"
         logger.info(f"Searching restaurants: {query}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = await _text_search(client, query, included_type="restaurant", max_results=max_results)
+        client = _get_http_client()
+        data = await _text_search(client, query, included_type="restaurant", max_results=max_results)
 
-            if data.get("error"):
-                result["error"] = data["error"]
-                return json.dumps(result)
+        if data.get("error"):
+            result["error"] = data["error"]
+            return _dumps(result)
 
-            places = data.get("places", [])
-            logger.info(f"Found {len(places)} restaurants in {city}")
+        places = data.get("places", [])
+        logger.info(f"Found {len(places)} restaurants in {city}")
 
-            for place in places:
-                restaurant = _parse_place(place, city)
-                restaurant["cuisine_types"] = [t for t in place.get("types", []) if "restaurant" not in t.lower()]
-                restaurant["popular_dishes"] = _extract_dishes_from_reviews(place.get("reviews", []))
-                result["restaurants"].append(restaurant)
+        for place in places:
+            restaurant = _parse_place(place, city)
+            restaurant["cuisine_types"] = [t for t in place.get("types", []) if "restaurant" not in t.lower()]
+            restaurant["popular_dishes"] = _extract_dishes_from_reviews(place.get("reviews", []))
+            result["restaurants"].append(restaurant)
 
     except Exception as e:
         result["error"] = str(e)
         logger.error(f"Restaurant search exception: {e}")
 
-    json_result = json.dumps(result)
+    json_result = _dumps(result)
 
     if not result.get("error") and result["restaurants"]:
         cache.set(cache_key, json_result, ttl=RESTAURANT_REVIEW_CACHE_TTL)
@@ -364,7 +401,7 @@ async def get_restaurant_details_places_api(
         JSON with detailed restaurant data.
     """
     if not GOOGLE_API_KEY:
-        return json.dumps({"error": "Google API key not configured"})
+        return _dumps({"error": "Google API key not configured"})
 
     result = {
         "source": "google_places_api",
@@ -376,21 +413,21 @@ async def get_restaurant_details_places_api(
     try:
         query = f"{restaurant_name} restaurant {city}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = await _text_search(client, query, included_type="restaurant", max_results=1)
+        client = _get_http_client()
+        data = await _text_search(client, query, included_type="restaurant", max_results=1)
 
-            if data.get("error") or not data.get("places"):
-                result["error"] = data.get("error") or "Restaurant not found"
-                return json.dumps(result)
+        if data.get("error") or not data.get("places"):
+            result["error"] = data.get("error") or "Restaurant not found"
+            return _dumps(result)
 
-            place = data["places"][0]
-            result.update(_parse_place(place, city))
-            result["popular_dishes"] = _extract_dishes_from_reviews(place.get("reviews", []))
+        place = data["places"][0]
+        result.update(_parse_place(place, city))
+        result["popular_dishes"] = _extract_dishes_from_reviews(place.get("reviews", []))
 
     except Exception as e:
         result["error"] = str(e)
 
-    return json.dumps(result)
+    return _dumps(result)
 
 
 @tool
@@ -410,10 +447,10 @@ async def search_attractions_places_api(
         JSON with detailed attraction data including photos, ratings, reviews.
     """
     if not GOOGLE_API_KEY:
-        return json.dumps({"error": "Google API key not configured", "attractions": []})
+        return _dumps({"error": "Google API key not configured", "attractions": []})
 
     cache = BrowserCache.get_instance()
-    cache_key = f"places_attractions_v2:{city}:{attraction_type or 'all'}"
+    cache_key = f"places_attractions_v3:{city}:{attraction_type or 'all'}:{max_results}"
 
     cached = cache.get(cache_key)
     if cached:
@@ -436,26 +473,26 @@ async def search_attractions_places_api(
 
         logger.info(f"Searching attractions: {query}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = await _text_search(client, query, max_results=max_results)
+        client = _get_http_client()
+        data = await _text_search(client, query, max_results=max_results)
 
-            if data.get("error"):
-                result["error"] = data["error"]
-                return json.dumps(result)
+        if data.get("error"):
+            result["error"] = data["error"]
+            return _dumps(result)
 
-            places = data.get("places", [])
-            logger.info(f"Found {len(places)} attractions in {city}")
+        places = data.get("places", [])
+        logger.info(f"Found {len(places)} attractions in {city}")
 
-            for place in places:
-                attraction = _parse_place(place, city)
-                attraction["category"] = _categorize_attraction(place.get("types", []))
-                result["attractions"].append(attraction)
+        for place in places:
+            attraction = _parse_place(place, city)
+            attraction["category"] = _categorize_attraction(place.get("types", []))
+            result["attractions"].append(attraction)
 
     except Exception as e:
         result["error"] = str(e)
         logger.error(f"Attraction search exception: {e}")
 
-    json_result = json.dumps(result)
+    json_result = _dumps(result)
 
     if not result.get("error") and result["attractions"]:
         cache.set(cache_key, json_result, ttl=ATTRACTION_CACHE_TTL)
@@ -478,7 +515,7 @@ async def get_attraction_details_places_api(
         JSON with detailed attraction data including photos.
     """
     if not GOOGLE_API_KEY:
-        return json.dumps({"error": "Google API key not configured"})
+        return _dumps({"error": "Google API key not configured"})
 
     result = {
         "source": "google_places_api",
@@ -490,21 +527,21 @@ async def get_attraction_details_places_api(
     try:
         query = f"{attraction_name} {city}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = await _text_search(client, query, max_results=1)
+        client = _get_http_client()
+        data = await _text_search(client, query, max_results=1)
 
-            if data.get("error") or not data.get("places"):
-                result["error"] = data.get("error") or "Attraction not found"
-                return json.dumps(result)
+        if data.get("error") or not data.get("places"):
+            result["error"] = data.get("error") or "Attraction not found"
+            return _dumps(result)
 
-            place = data["places"][0]
-            result.update(_parse_place(place, city))
-            result["category"] = _categorize_attraction(place.get("types", []))
+        place = data["places"][0]
+        result.update(_parse_place(place, city))
+        result["category"] = _categorize_attraction(place.get("types", []))
 
     except Exception as e:
         result["error"] = str(e)
 
-    return json.dumps(result)
+    return _dumps(result)
 
 
 @tool
@@ -525,10 +562,10 @@ async def search_hotels_places_api(
     """
     if not GOOGLE_API_KEY:
         logger.error("Google API key not configured for hotel search")
-        return json.dumps({"error": "Google API key not configured", "hotels": []})
+        return _dumps({"error": "Google API key not configured", "hotels": []})
 
     cache = BrowserCache.get_instance()
-    cache_key = f"places_hotels_v2:{city}:{budget_level or 'all'}"
+    cache_key = f"places_hotels_v3:{city}:{budget_level or 'all'}:{max_results}"
 
     cached = cache.get(cache_key)
     if cached:
@@ -554,26 +591,26 @@ async def search_hotels_places_api(
 
         logger.info(f"Searching hotels: {query}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = await _text_search(client, query, included_type="hotel", max_results=max_results)
+        client = _get_http_client()
+        data = await _text_search(client, query, included_type="hotel", max_results=max_results)
 
-            if data.get("error"):
-                result["error"] = data["error"]
-                logger.error(f"Hotel search failed: {result['error']}")
-                return json.dumps(result)
+        if data.get("error"):
+            result["error"] = data["error"]
+            logger.error(f"Hotel search failed: {result['error']}")
+            return _dumps(result)
 
-            places = data.get("places", [])
-            logger.info(f"Found {len(places)} hotels in {city}")
+        places = data.get("places", [])
+        logger.info(f"Found {len(places)} hotels in {city}")
 
-            for place in places:
-                hotel = _parse_place(place, city)
-                result["hotels"].append(hotel)
+        for place in places:
+            hotel = _parse_place(place, city)
+            result["hotels"].append(hotel)
 
     except Exception as e:
         result["error"] = str(e)
         logger.error(f"Hotel search exception: {e}")
 
-    json_result = json.dumps(result)
+    json_result = _dumps(result)
 
     if not result.get("error") and result["hotels"]:
         cache.set(cache_key, json_result, ttl=ATTRACTION_CACHE_TTL)
@@ -601,9 +638,9 @@ async def search_all_city_data(city: str, budget_level: str = "mid_range") -> di
         return_exceptions=True,
     )
 
-    attractions_data = json.loads(results[0]) if not isinstance(results[0], Exception) else {"attractions": [], "error": str(results[0])}
-    restaurants_data = json.loads(results[1]) if not isinstance(results[1], Exception) else {"restaurants": [], "error": str(results[1])}
-    hotels_data = json.loads(results[2]) if not isinstance(results[2], Exception) else {"hotels": [], "error": str(results[2])}
+    attractions_data = orjson.loads(results[0]) if not isinstance(results[0], Exception) else {"attractions": [], "error": str(results[0])}
+    restaurants_data = orjson.loads(results[1]) if not isinstance(results[1], Exception) else {"restaurants": [], "error": str(results[1])}
+    hotels_data = orjson.loads(results[2]) if not isinstance(results[2], Exception) else {"hotels": [], "error": str(results[2])}
 
     return {
         "city": city,
@@ -0,0 +1,70 @@
+"""Unit tests for shared BaseAgent helpers."""
+
+from src.agents import base
+from src.agents.critic import CriticAgent
+from src.config.constants import LLM_HTTP_TIMEOUT_SECONDS
+
+
+ALLOCATIONS = [
+    {"city": "Jaipur", "country": "India", "days": 1, "visit_order": 3},
+    {"city": "Udaipur", "country": "India", "days": 2, "visit_order": 1},
+    {"city": "Jodhpur", "country": "India", "days": 3, "visit_order": 2},
+]
+
+
+class TestCityHelpers:
+    """Tests for city allocation helpers."""
+
+    def test_extract_cities_in_visit_order(self, mock_structured_llm):
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        cities = agent._extract_cities({"city_allocations": ALLOCATIONS})
+
+        assert cities == ["Udaipur", "Jodhpur", "Jaipur"]
+
+    def test_get_city_days(self, mock_structured_llm):
+        agent = CriticAgent(llm=mock_structured_llm)
+        state = {"city_allocations": ALLOCATIONS}
+
+        assert agent._get_city_days(state, "Jodhpur") == 3
+        assert agent._get_city_days(state, "Agra") == 1
+
+    def test_sorted_allocations_leave_input_untouched(self, mock_structured_llm):
+        agent = CriticAgent(llm=mock_structured_llm)
+        allocations = list(ALLOCATIONS)
+
+        result = agent._sorted_allocations(allocations)
+
+        assert [a["city"] for a in result] == ["Udaipur", "Jodhpur", "Jaipur"]
+        assert allocations == ALLOCATIONS
+        assert agent._sorted_allocations(None) == []
+
+
+class TestSharedHttpClient:
+    """Tests for the shared OpenAI HTTP client lifecycle."""
+
+    async def test_close_drops_client_and_llms(self):
+        client = base._get_http_async_client()
+        base._build_llm("gpt-4o-mini", 0.0, "sk-test", "test")
+
+        await base.close_http_async_client()
+
+        assert client.is_closed
+        assert base._build_llm.cache_info().currsize == 0
+        assert base._get_http_async_client() is not client
+        await base.close_http_async_client()
+        await base.close_http_async_client()
+
+    async def test_llm_carries_request_timeout(self):
+        llm = base._build_llm("gpt-4o-mini", 0.0, "sk-test", "test")
+
+        assert llm.request_timeout == LLM_HTTP_TIMEOUT_SECONDS
+        await base.close_http_async_client()
+
+    async def test_prompt_cache_key_sent_in_body(self):
+        llm = base._build_llm("gpt-4o-mini", 0.0, "sk-test", "travel-planner:critic")
+
+        payload = llm._get_request_payload([("user", "hi")])
+
+        assert payload["extra_body"] == {"prompt_cache_key": "travel-planner:critic"}
+        await base.close_http_async_client()
@@ -0,0 +1,79 @@
+"""Unit tests for the Clarification agent."""
+
+import pytest
+
+from src.agents.clarification import ClarificationAgent
+from src.models.agent_outputs import ClarificationOutput, ClarificationQuestion
+
+
+class TestQuickCheck:
+    """Tests for the no-LLM completeness check."""
+
+    @pytest.mark.parametrize(
+        "request_text",
+        [
+            "5 days in Tokyo and Kyoto from New York, Jan 10-15 2026, relaxed pace, vegetarian",
+            "Trip to Goa, Hampi from Mumbai 2026-03-02 to 2026-03-06, vegan, moderate pace",
+            "Visiting Jaipur, Udaipur and Jodhpur from New Delhi, Mar 3-8, vegetarian, relaxed pace",
+            "Trip to Goa from Mumbai 2026-03-02 to 2026-03-06, vegan, moderate pace",
+        ],
+    )
+    def test_complete_request_skips_llm(self, mock_structured_llm, request_text):
+        agent = ClarificationAgent(llm=mock_structured_llm)
+
+        assert agent._quick_check(request_text) == {
+            "clarification_needed": False,
+            "clarification_questions": [],
+        }
+
+    @pytest.mark.parametrize(
+        "request_text",
+        [
+            "Plan a 5-day trip to Rajasthan",
+            "Plan a trip to Tokyo from January 15-22, 2026, relaxed pace, vegetarian",
+            "7 days in Mumbai and Goa from Delhi, vegetarian food only, relaxed pace",
+            "Plan a trip to Rajasthan from Delhi, March 3-8, vegetarian, relaxed pace",
+            "Week in Japan from London, May 2 to May 9, vegan, relaxed pace",
+            "I want to Go somewhere from Boston on June 3, vegan, relaxed pace",
+            "A week in Japan, Vegetarian food please, relaxed pace, from Delhi, Jan 5",
+            "Trip to Rajasthan and Kerala from Mumbai on March 3, vegan, relaxed",
+            "Trip to Japan and Korea from Delhi, 2026-03-03, relaxed pace, halal",
+            "Plan a trip to Europe, Asia from Boston on May 4, no restrictions, leisurely",
+            "Trip to Rajasthan from Delhi on March 3, staying in Jaipur, vegan, relaxed pace",
+        ],
+    )
+    def test_incomplete_request_needs_llm(self, mock_structured_llm, request_text):
+        agent = ClarificationAgent(llm=mock_structured_llm)
+
+        assert agent._quick_check(request_text) is None
+
+
+class TestClarificationRun:
+    """Tests for ClarificationAgent.run."""
+
+    async def test_questions_are_serialized(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = ClarificationOutput(
+            needs_clarification=True,
+            questions=[
+                ClarificationQuestion(
+                    question_id="travel_dates",
+                    question_text="When are you traveling?",
+                    question_type="travel_dates",
+                ),
+            ],
+        )
+        agent = ClarificationAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"user_request": "Plan a 5-day trip to Rajasthan"})
+
+        assert update["clarification_needed"] is True
+        assert update["clarification_questions"] == [
+            {
+                "question_id": "travel_dates",
+                "question_text": "When are you traveling?",
+                "question_type": "travel_dates",
+                "required": True,
+                "options": [],
+                "allow_multiple": False,
+            }
+        ]
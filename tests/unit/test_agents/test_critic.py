@@ -0,0 +1,135 @@
+"""Unit tests for the Critic agent."""
+
+from src.agents.critic import CriticAgent
+from src.models.agent_outputs import CriticOutput, IssueSeverity, ValidationIssue
+
+
+def _critic_output(**overrides) -> CriticOutput:
+    data = {
+        "is_valid": True,
+        "overall_score": 85,
+        "issues": [
+            ValidationIssue(
+                category="timing",
+                description="Day 2 is packed",
+                severity=IssueSeverity.HIGH,
+                affected_days=[2],
+                affected_cities=["Jodhpur"],
+                suggested_fix="Move one fort visit to day 3",
+            ),
+        ],
+        "requires_replanning": False,
+        "strengths": ["Logical route"],
+    }
+    data.update(overrides)
+    return CriticOutput(**data)
+
+
+class TestCriticRun:
+    """Tests for CriticAgent.run state updates."""
+
+    async def test_validation_result_shape(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = _critic_output()
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"iteration_count": 0})
+
+        result = update["validation_result"]
+        assert result["is_valid"] is True
+        assert result["overall_score"] == 85
+        assert result["strengths"] == ["Logical route"]
+        assert result["final_recommendations"] == []
+        assert result["issues"] == [
+            {
+                "category": "timing",
+                "description": "Day 2 is packed",
+                "severity": "high",
+                "affected_days": [2],
+                "affected_cities": ["Jodhpur"],
+                "suggested_fix": "Move one fort visit to day 3",
+            }
+        ]
+        assert "replan_focus" not in result
+        assert update["critic_feedback"] is None
+
+    async def test_replanning_sets_feedback(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = _critic_output(
+            is_valid=False,
+            requires_replanning=True,
+            replan_focus="timing",
+        )
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"iteration_count": 0})
+
+        assert update["iteration_count"] == 1
+        assert "Focus area: timing" in update["critic_feedback"]
+        assert "[HIGH] Day 2 is packed" in update["critic_feedback"]
+
+    async def test_issues_ranked_and_capped(self, mock_structured_llm):
+        issues = [
+            ValidationIssue(category="balance", description=f"Low {i}", severity=IssueSeverity.LOW)
+            for i in range(12)
+        ]
+        issues.append(
+            ValidationIssue(category="logistics", description="Broken", severity=IssueSeverity.CRITICAL)
+        )
+        mock_structured_llm.ainvoke.return_value = _critic_output(
+            issues=issues,
+            requires_replanning=True,
+        )
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"iteration_count": 0})
+
+        stored = update["validation_result"]["issues"]
+        assert len(stored) == 10
+        assert stored[0]["severity"] == "critical"
+        assert "[CRITICAL] Broken" in update["critic_feedback"]
+        assert "Low 0" not in update["critic_feedback"]
+
+    async def test_forced_approval_note_survives_cap(self, mock_structured_llm):
+        issues = [
+            ValidationIssue(category="timing", description=f"Critical {i}", severity=IssueSeverity.CRITICAL)
+            for i in range(12)
+        ]
+        mock_structured_llm.ainvoke.return_value = _critic_output(
+            is_valid=False,
+            issues=issues,
+            requires_replanning=True,
+        )
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"iteration_count": 3})
+
+        stored = update["validation_result"]["issues"]
+        assert len(stored) == 10
+        assert stored[-1]["category"] == "process"
+        assert stored[0]["description"] == "Critical 0"
+        assert update["validation_result"]["is_valid"] is True
+
+
+class TestValidationPrompt:
+    """Tests for the validation prompt builder."""
+
+    def test_budget_lists_only_costs(self, mock_structured_llm):
+        agent = CriticAgent(llm=mock_structured_llm)
+
+        prompt = agent._build_validation_prompt(
+            trip_summary={},
+            city_allocations=[],
+            route_validation={"warnings": ["a", "b", "c", "d"]},
+            route_segments=[],
+            attractions=[{"city": "Jaipur", "name": f"Place {i}"} for i in range(8)],
+            food_recommendations=[],
+            transport_options=[],
+            budget_breakdown={"total": 900, "food": 150, "money_saving_tips": ["Eat local"]},
+            iteration=0,
+            max_iterations=3,
+        )
+
+        assert "Breakdown: food: $150" in prompt
+        assert "Eat local" not in prompt
+        assert "Warnings: 4 (a; b; c, ...)" in prompt
+        assert "Place 4" in prompt
+        assert "Place 5" not in prompt
@@ -0,0 +1,269 @@
+"""Unit tests for the Food/Culture agent."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents import food_culture
+from src.agents.food_culture import FoodCultureAgent
+from src.config.constants import (
+    FOOD_CULTURE_MAX_CONCURRENT_CITIES,
+    FOOD_CULTURE_REVIEWS_FOR_MATCHING,
+    REVIEW_CACHE_TTL_SECONDS,
+)
+from src.models.agent_outputs import FoodCultureOutput
+from src.models.itinerary import BudgetLevel, Meal
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    food_culture._REVIEW_CACHE.clear()
+    food_culture._RECOMMENDATION_CACHE.clear()
+    yield
+    food_culture._REVIEW_CACHE.clear()
+    food_culture._RECOMMENDATION_CACHE.clear()
+
+
+class TestFoodCultureRun:
+    """Tests for FoodCultureAgent.run."""
+
+    async def test_cities_processed_with_bounded_concurrency(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        in_flight = 0
+        peak = 0
+
+        async def fake_scrape(city, country):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return []
+
+        async def fake_recommendations(city, **kwargs):
+            nonlocal in_flight
+            # A city holds its slot from the scrape through the LLM call
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FoodCultureOutput(
+                city=city,
+                must_try_dishes=[],
+                restaurant_recommendations=[],
+                cultural_dos=["Greet with namaste"],
+            )
+
+        allocations = [
+            {"city": f"City {i}", "country": "India", "days": 1}
+            for i in range(FOOD_CULTURE_MAX_CONCURRENT_CITIES + 3)
+        ]
+        allocations.append({"city": "", "country": "India"})
+
+        with patch.object(agent, "_scrape_restaurant_reviews", side_effect=fake_scrape), \
+             patch.object(agent, "_get_city_recommendations", side_effect=fake_recommendations):
+            update = await agent.run({"city_allocations": allocations, "trip_summary": {}})
+            assert agent._get_city_recommendations.await_count == len(allocations) - 1
+
+        assert peak == FOOD_CULTURE_MAX_CONCURRENT_CITIES
+        assert update["cultural_tips"] == ["Greet with namaste"]
+
+    def test_food_recommendation_merges_review_data(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        meal = Meal(
+            meal_type="dinner",
+            restaurant_name="LMB",
+            cuisine_type="Rajasthani",
+            budget_level=BudgetLevel.MID_RANGE,
+            estimated_cost_usd=12,
+        )
+
+        generated = agent._build_food_recommendation("Jaipur", meal, None)
+        reviewed = agent._build_food_recommendation(
+            "Jaipur", meal, {"rating": 4.5, "source": "zomato", "popular_dishes": ["Ghewar"]}
+        )
+
+        assert generated["review_source"] == "llm_generated"
+        assert generated["photo_urls"] == []
+        assert "rating" not in generated
+        assert reviewed["budget_level"] == "mid_range"
+        assert reviewed["review_source"] == "zomato"
+        assert reviewed["popular_dishes_from_reviews"] == ["Ghewar"]
+        assert reviewed["opening_hours"] == []
+
+
+class TestBuildReviewsSection:
+    """Tests for the scraped-review prompt section."""
+
+    def test_format(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        reviews = [
+            {
+                "name": "LMB",
+                "rating": 4.46,
+                "review_count": 12345,
+                "source": "zomato",
+                "cuisine_types": ["Rajasthani", "Sweets", "North Indian", "Cafe"],
+                "price_level": "$$",
+                "review_highlights": ["Best ghewar in town"],
+                "popular_dishes": ["Ghewar"],
+            },
+            {"name": "Tapri"},
+        ]
+
+        section = agent._build_reviews_section(reviews)
+
+        assert section == (
+            "\nREAL RESTAURANT REVIEWS (from Google Maps, Zomato, Swiggy):\n"
+            "(Prioritize these highly-rated restaurants in your recommendations)\n\n"
+            "- LMB ★4.5 (12,345 reviews) [zomato] | Rajasthani, Sweets, North Indian | $$\n"
+            '  → "Best ghewar in town"\n'
+            "  → Popular: Ghewar\n"
+            "- Tapri [unknown]"
+        )
+        assert agent._build_reviews_section([]) == ""
+
+
+class TestFindMatchingReview:
+    """Tests for review matching against the prebuilt index."""
+
+    def test_match_order(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        reviews = [
+            {"name": "Laxmi Misthan Bhandar", "source": "zomato"},
+            {"name": "Tapri Central", "source": "google_places_api"},
+            {"name": "tapri central ", "source": "swiggy"},
+        ]
+        index = agent._build_review_index(reviews)
+
+        assert agent._find_matching_review("Tapri Central", index) is reviews[1]
+        assert agent._find_matching_review("Tapri", index) is reviews[1]
+        assert agent._find_matching_review("Laxmi Bhandar Sweets", index) is reviews[0]
+        assert agent._find_matching_review("Central Tapri", index) is reviews[1]
+        assert agent._find_matching_review("Suvarna Mahal", index) is None
+        assert agent._find_matching_review(None, index) is None
+        assert agent._find_matching_review("Tapri", agent._build_review_index([])) is None
+
+    def test_fuzzy_matching_limited_to_top_reviews(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        reviews = [
+            {"name": f"Place {i}"} for i in range(FOOD_CULTURE_REVIEWS_FOR_MATCHING)
+        ]
+        reviews.append({"name": "Suvarna Mahal"})
+        index = agent._build_review_index(reviews)
+
+        assert agent._find_matching_review("suvarna mahal", index) is reviews[-1]
+        assert agent._find_matching_review("Suvarna", index) is None
+
+
+class TestScrapeRestaurantReviews:
+    """Tests for FoodCultureAgent._scrape_restaurant_reviews."""
+
+    async def test_sources_fetched_concurrently_and_merged(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        google = AsyncMock(return_value=json.dumps(
+            {"restaurants": [{"name": "Lassiwala", "rating": 4.2, "review_count": 900}]}
+        ))
+        zomato = AsyncMock(side_effect=RuntimeError("blocked"))
+        swiggy = AsyncMock(return_value=json.dumps(
+            {"restaurants": [{"name": "LMB", "rating": 4.5, "review_count": 300}]}
+        ))
+
+        with patch.object(food_culture, "search_restaurants_places_api", MagicMock(ainvoke=google)), \
+             patch.object(food_culture, "scrape_zomato_restaurants", MagicMock(ainvoke=zomato)), \
+             patch.object(food_culture, "scrape_swiggy_restaurants", MagicMock(ainvoke=swiggy)):
+            reviews = await agent._scrape_restaurant_reviews("Jaipur", "India")
+
+        assert [(r["name"], r["source"]) for r in reviews] == [
+            ("LMB", "swiggy"),
+            ("Lassiwala", "google_places_api"),
+        ]
+        zomato.assert_awaited_once()
+        assert reviews[1]["_name_lower"] == "lassiwala"
+
+    async def test_non_india_skips_local_scrapers(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        google = AsyncMock(return_value=json.dumps({"error": "quota"}))
+        zomato = AsyncMock()
+
+        with patch.object(food_culture, "search_restaurants_places_api", MagicMock(ainvoke=google)), \
+             patch.object(food_culture, "scrape_zomato_restaurants", MagicMock(ainvoke=zomato)):
+            reviews = await agent._scrape_restaurant_reviews("Lisbon", "Portugal")
+
+        assert reviews == []
+        zomato.assert_not_awaited()
+
+
+class TestReviewCache:
+    """Tests for the per-city restaurant review cache."""
+
+    async def test_concurrent_requests_scrape_once(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+
+        async def fake_fetch(city, country):
+            await asyncio.sleep(0.01)
+            return [{"name": "LMB", "source": "zomato"}]
+
+        with patch.object(agent, "_fetch_restaurant_reviews", side_effect=fake_fetch):
+            results = await asyncio.gather(
+                agent._scrape_restaurant_reviews("Jaipur", "India"),
+                agent._scrape_restaurant_reviews("jaipur", "india"),
+            )
+            await agent._scrape_restaurant_reviews("Jaipur", "India")
+            assert agent._fetch_restaurant_reviews.await_count == 1
+
+        assert results[0] == results[1] == [{"name": "LMB", "source": "zomato"}]
+        assert food_culture._REVIEW_CACHE._locks == {}
+
+    async def test_expired_or_empty_results_are_refetched(self, mock_structured_llm):
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        fetch = AsyncMock(side_effect=[[], [{"name": "LMB"}], [{"name": "Tapri"}]])
+
+        with patch.object(agent, "_fetch_restaurant_reviews", fetch):
+            assert await agent._scrape_restaurant_reviews("Jaipur", "India") == []
+            assert await agent._scrape_restaurant_reviews("Jaipur", "India") == [{"name": "LMB"}]
+
+            key = ("jaipur", "india")
+            fetched_at, reviews = food_culture._REVIEW_CACHE._entries[key]
+            food_culture._REVIEW_CACHE._entries[key] = (
+                fetched_at - REVIEW_CACHE_TTL_SECONDS, reviews
+            )
+            assert await agent._scrape_restaurant_reviews("Jaipur", "India") == [{"name": "Tapri"}]
+
+        assert fetch.await_count == 3
+
+
+class TestRecommendationCache:
+    """Tests for the per-city food/culture output cache."""
+
+    async def test_identical_inputs_skip_llm(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = FoodCultureOutput(
+            city="",
+            must_try_dishes=["Dal baati churma"],
+            restaurant_recommendations=[],
+        )
+        agent = FoodCultureAgent(llm=mock_structured_llm)
+        kwargs = {
+            "country": "India",
+            "days": 2,
+            "budget_level": "mid_range",
+            "traveler_profile": "solo",
+            "dietary_preferences": ["vegetarian", "jain"],
+            "scraped_reviews": [{"name": "LMB", "rating": 4.5, "source": "zomato"}],
+        }
+
+        first = await agent._get_city_recommendations(city="Jaipur", **kwargs)
+        first.must_try_dishes.append("Pyaaz kachori")
+        second = await agent._get_city_recommendations(
+            city="Jaipur", **{**kwargs, "dietary_preferences": ["jain", "vegetarian"]}
+        )
+
+        assert mock_structured_llm.ainvoke.await_count == 1
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+        assert "- Days in Jaipur: 2" in prompt
+        assert "- Dietary preferences: vegetarian, jain" in prompt
+        assert "2 DINNER restaurants" in prompt
+        assert second.city == "Jaipur"
+        assert second.must_try_dishes == ["Dal baati churma"]
+
+        await agent._get_city_recommendations(city="Jaipur", **{**kwargs, "days": 3})
+        assert mock_structured_llm.ainvoke.await_count == 2
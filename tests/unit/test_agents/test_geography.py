@@ -0,0 +1,42 @@
+"""Unit tests for the Geography agent."""
+
+from src.agents.geography import GeographyAgent
+
+
+ALLOCATIONS = [
+    {"city": "Udaipur", "country": "India", "days": 2, "visit_order": 1},
+    {"city": "Jaipur", "country": "India", "days": 1, "visit_order": 2},
+    {"city": "Jodhpur", "country": "India", "days": 2, "visit_order": 3},
+]
+
+
+class TestGeographyRun:
+    """Tests for GeographyAgent.run state updates."""
+
+    async def test_unchanged_route(self, mock_structured_llm, sample_geography_output):
+        mock_structured_llm.ainvoke.return_value = sample_geography_output
+        agent = GeographyAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"city_allocations": ALLOCATIONS, "trip_summary": {}})
+
+        assert update["route_validation"]["is_valid"] is True
+        assert update["route_segments"][0]["recommended_transport"] == "train"
+        assert "city_allocations" not in update
+
+    async def test_changed_route_reorders_allocations(
+        self, mock_structured_llm, sample_geography_output
+    ):
+        mock_structured_llm.ainvoke.return_value = sample_geography_output.model_copy(
+            update={"route_changed": True}
+        )
+        agent = GeographyAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"city_allocations": ALLOCATIONS, "trip_summary": {}})
+
+        assert [(c["city"], c["visit_order"]) for c in update["city_allocations"]] == [
+            ("Udaipur", 1),
+            ("Jodhpur", 2),
+            ("Jaipur", 3),
+        ]
+        # Input allocations are not mutated
+        assert ALLOCATIONS[1]["visit_order"] == 2
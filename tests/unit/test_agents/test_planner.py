@@ -0,0 +1,65 @@
+"""Unit tests for the Planner agent."""
+
+import pytest
+
+from src.agents import planner
+from src.agents.planner import PlannerAgent
+
+
+@pytest.fixture(autouse=True)
+def clear_plan_cache():
+    planner._PLAN_CACHE.clear()
+    yield
+    planner._PLAN_CACHE.clear()
+
+
+class TestPlannerRun:
+    """Tests for PlannerAgent.run state updates."""
+
+    async def test_state_update(self, mock_structured_llm, sample_planner_output):
+        mock_structured_llm.ainvoke.return_value = sample_planner_output
+        agent = PlannerAgent(llm=mock_structured_llm)
+
+        update = await agent.run({"user_request": "Rajasthan for 5 days"})
+
+        assert update["trip_summary"]["budget_level"] == "mid_range"
+        assert [c["city"] for c in update["city_allocations"]] == [
+            "Udaipur", "Jodhpur", "Jaipur",
+        ]
+        assert update["critic_feedback"] is None
+
+    async def test_repeat_request_reuses_plan(self, mock_structured_llm, sample_planner_output):
+        mock_structured_llm.ainvoke.return_value = sample_planner_output
+        agent = PlannerAgent(llm=mock_structured_llm)
+
+        first = await agent.run({"user_request": "Rajasthan for 5 days"})
+        second = await agent.run({"user_request": "  Rajasthan   for 5 days\n"})
+
+        assert mock_structured_llm.ainvoke.await_count == 1
+        assert second == first
+
+        await agent.run({"user_request": "rajasthan for 5 days"})
+        assert mock_structured_llm.ainvoke.await_count == 2
+
+    async def test_replan_keyed_by_feedback(self, mock_structured_llm, sample_planner_output):
+        mock_structured_llm.ainvoke.return_value = sample_planner_output
+        agent = PlannerAgent(llm=mock_structured_llm)
+        replan = {
+            "user_request": "Rajasthan for 5 days",
+            "critic_feedback": "Too rushed",
+            "iteration_count": 1,
+        }
+
+        await agent.run({"user_request": "Rajasthan for 5 days"})
+        await agent.run(replan)
+
+        assert mock_structured_llm.ainvoke.await_count == 2
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+        assert "Too rushed" in prompt
+
+        await agent.run(replan)
+        assert mock_structured_llm.ainvoke.await_count == 2
+
+        await agent.run({**replan, "iteration_count": 2})
+        await agent.run({**replan, "critic_feedback": "Too slow"})
+        assert mock_structured_llm.ainvoke.await_count == 4
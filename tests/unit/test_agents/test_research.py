@@ -0,0 +1,466 @@
+"""Unit tests for the Research agent."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agents import research
+from src.agents.research import ResearchAgent
+from src.config.constants import RESEARCH_CACHE_TTL_SECONDS, RESEARCH_MAX_CONCURRENT_CITIES
+from src.models.agent_outputs import (
+    FallbackAttraction,
+    FallbackAttractionList,
+    FallbackHotel,
+    FallbackHotelList,
+    ResearchOutput,
+)
+from src.models.itinerary import Attraction
+from src.tools.google_api import _categorize_attraction, _parse_place
+
+
+def _places_tools(attractions=None, hotels=None, delay=0.0, counter=None):
+    """Patch the Places API tools used by the research agent."""
+
+    async def search(payload, key, items):
+        if counter is not None:
+            counter["in_flight"] += 1
+            counter["peak"] = max(counter["peak"], counter["in_flight"])
+        await asyncio.sleep(delay)
+        if counter is not None:
+            counter["in_flight"] -= 1
+        return json.dumps({key: items or [], "error": None if items else "no results"})
+
+    async def attractions_search(payload):
+        return await search(payload, "attractions", attractions)
+
+    async def hotels_search(payload):
+        return await search(payload, "hotels", hotels)
+
+    return patch.multiple(
+        research,
+        search_attractions_places_api=MagicMock(ainvoke=attractions_search),
+        search_hotels_places_api=MagicMock(ainvoke=hotels_search),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_research_cache():
+    research._RESEARCH_CACHE.clear()
+    yield
+    research._RESEARCH_CACHE.clear()
+
+
+class TestResearchRun:
+    """Tests for ResearchAgent.run."""
+
+    async def test_places_searches_bounded(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        counter = {"in_flight": 0, "peak": 0}
+        allocations = [
+            {"city": f"City {i}", "country": "India", "days": 1}
+            for i in range(RESEARCH_MAX_CONCURRENT_CITIES + 2)
+        ]
+
+        with _places_tools(delay=0.01, counter=counter):
+            update = await agent.run({"city_allocations": allocations})
+
+        # Two searches (attractions + hotels) per city in flight
+        assert counter["peak"] == 2 * RESEARCH_MAX_CONCURRENT_CITIES
+        assert update["attractions"] == []
+
+    async def test_results_keep_visit_order(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        cities = ["Udaipur", "Jodhpur", "Jaipur"]
+
+        async def fake_research(allocation, budget_level, semaphore):
+            city = allocation["city"]
+            if city == "Jodhpur":
+                raise RuntimeError("boom")
+            # Earlier cities finish last
+            await asyncio.sleep(0.01 * (len(cities) - cities.index(city)))
+            attraction = Attraction(
+                name=f"{city} Fort", city=city, category="fort", estimated_duration_hours=2
+            )
+            return [attraction], [{"name": f"{city} Hotel"}], [f"Places: {city}"]
+
+        with patch.object(agent, "_research_city", side_effect=fake_research):
+            update = await agent.run({
+                "city_allocations": [{"city": c, "country": "India"} for c in cities],
+            })
+
+        assert [a["name"] for a in update["attractions"]] == ["Udaipur Fort", "Jaipur Fort"]
+        assert update["hotels"] == [{"name": "Udaipur Hotel"}, {"name": "Jaipur Hotel"}]
+        assert update["research_sources"] == ["Places: Udaipur", "Places: Jaipur"]
+
+    async def test_attraction_and_hotel_fallbacks_overlap(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        log = []
+
+        def fallback(name, result):
+            async def generate(**kwargs):
+                log.append(f"{name}:start")
+                await asyncio.sleep(0.01)
+                log.append(f"{name}:end")
+                return result
+
+            return generate
+
+        with _places_tools(), \
+             patch.object(agent, "_generate_fallback_attractions", side_effect=fallback("attractions", [])), \
+             patch.object(agent, "_generate_fallback_hotels", side_effect=fallback("hotels", [{"name": "Hotel"}])):
+            update = await agent.run({
+                "city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}],
+            })
+
+        assert log.index("hotels:start") < log.index("attractions:end")
+        assert update["hotels"] == [{"name": "Hotel"}]
+        assert update["research_sources"] == [
+            "LLM Knowledge Base: Jaipur hotels (API unavailable)"
+        ]
+
+    async def test_structuring_failure_keeps_places_data(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.side_effect = ValueError("invalid JSON")
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [{"name": "Amber Fort", "rating": 4.6}, {"name": "", "category": "landmark"}]
+        hotels = [{"name": "Rambagh Palace"}]
+
+        with _places_tools(attractions=places, hotels=hotels):
+            update = await agent.run({
+                "city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}],
+            })
+
+        # Only the structuring call was made; no knowledge-base fallback
+        assert mock_structured_llm.ainvoke.await_count == 1
+        assert [(a["name"], a["category"], a["rating"]) for a in update["attractions"]] == [
+            ("Amber Fort", "attraction", 4.6),
+        ]
+        assert update["hotels"] == hotels
+
+    async def test_attraction_dicts(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = ResearchOutput(
+            city="Jaipur",
+            attractions_found=[
+                Attraction(
+                    name="Amber Fort",
+                    city="Jaipur",
+                    category="fort",
+                    estimated_duration_hours=3,
+                ),
+            ],
+        )
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [{"name": "Amber Fort", "rating": 4.6, "photo_urls": ["https://img/1"]}]
+        hotels = [{"name": "Rambagh Palace", "city": "Jaipur"}]
+
+        with _places_tools(attractions=places, hotels=hotels):
+            update = await agent.run({
+                "city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}],
+            })
+
+        assert update["attractions"] == [
+            {
+                "name": "Amber Fort",
+                "city": "Jaipur",
+                "description": None,
+                "category": "fort",
+                "estimated_duration_hours": 3.0,
+                "address": None,
+                "opening_hours": None,
+                "entrance_fee_usd": None,
+                "booking_required": False,
+                "tips": None,
+                "source_url": None,
+                "rating": 4.6,
+                "photo_urls": ["https://img/1"],
+            }
+        ]
+        assert update["hotels"] == hotels
+
+    async def test_complete_places_data_skips_llm(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [
+            {
+                "name": f"Fort {i}",
+                "category": "landmark",
+                "address": f"{i} Amer Rd, Jaipur",
+                "rating": 4.5,
+                "opening_hours": ["Monday: 8 AM - 6 PM", "Tuesday: 8 AM - 6 PM"],
+                "review_highlights": [{"text": "Stunning views", "rating": 5}],
+                "editorial_summary": "Hilltop fort",
+            }
+            for i in range(4)
+        ]
+
+        with _places_tools(attractions=places, hotels=[{"name": "Rambagh Palace"}]):
+            update = await agent.run({
+                "city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}],
+            })
+
+        mock_structured_llm.ainvoke.assert_not_awaited()
+        first = update["attractions"][0]
+        assert len(update["attractions"]) == 4
+        assert first["description"] == "Hilltop fort"
+        assert first["estimated_duration_hours"] == 1.5
+        assert first["opening_hours"] == "Monday: 8 AM - 6 PM; Tuesday: 8 AM - 6 PM"
+        assert first["review_highlights"] == ["Stunning views"]
+
+    async def test_duplicate_places_results_dropped(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [
+            {"name": "Amber Fort", "category": "landmark", "address": "Amer", "rating": 4.6},
+            {"name": "amber fort!", "category": "landmark", "address": "Amer Rd"},
+            {"name": "Hawa Mahal", "category": "landmark", "address": "Badi Choupad"},
+        ]
+        for place in places:
+            place["editorial_summary"] = "Historic site"
+
+        with _places_tools(attractions=places, hotels=[{"name": "Rambagh Palace"}]):
+            update = await agent.run({
+                "city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}],
+            })
+
+        assert [(a["name"], a.get("rating")) for a in update["attractions"]] == [
+            ("Amber Fort", 4.6),
+            ("Hawa Mahal", None),
+        ]
+
+    def test_places_data_built_directly_unless_incomplete(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [
+            {"name": "Amber Fort", "category": "landmark", "address": "Amer", "editorial_summary": "Hilltop fort"},
+            {"name": "Hawa Mahal", "category": "landmark", "address": "", "editorial_summary": "Palace"},
+        ]
+
+        assert agent._attractions_from_places("Jaipur", places, 2) == []
+        assert len(agent._attractions_from_places("Jaipur", places[:1], 2)) == 1
+        assert len(agent._attractions_from_places("Jaipur", places, 1)) == 1
+
+    def test_tool_placeholders_count_as_missing(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        place = _parse_place(
+            {"formattedAddress": "Amer, Jaipur", "editorialSummary": {"text": "Hilltop fort"}},
+            "Jaipur",
+        )
+        place["category"] = _categorize_attraction(["establishment"])
+        named = {**place, "name": "Amber Fort"}
+
+        assert agent._attractions_from_places("Jaipur", [place], 1) == []
+        assert agent._attractions_from_places("Jaipur", [named], 1) == []
+        assert agent._attractions_from_places("Jaipur", [{**named, "category": "landmark"}], 1)
+        assert agent._attractions_from_places("Jaipur", [place], 1, require_complete=False) == []
+        assert [
+            a.category
+            for a in agent._attractions_from_places("Jaipur", [named], 1, require_complete=False)
+        ] == ["attraction"]
+
+
+class TestResearchCache:
+    """Tests for the per-city research cache."""
+
+    async def test_repeat_city_reuses_research(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        calls = 0
+
+        async def fake_fetch(city, country, days, budget_level, semaphore):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            attraction = Attraction(
+                name="Amber Fort", city=city, category="fort", estimated_duration_hours=3
+            )
+            return [attraction], [{"name": "Rambagh Palace", "photo_urls": []}], ["Places"]
+
+        state = {
+            "city_allocations": [{"city": "Jaipur", "country": "India", "days": 2}],
+            "trip_summary": {"budget_level": "luxury"},
+        }
+
+        with patch.object(agent, "_fetch_city_research", side_effect=fake_fetch):
+            first, second = await asyncio.gather(agent.run(state), agent.run(state))
+            first["hotels"][0]["photo_urls"].append("mutated")
+            third = await agent.run(state)
+            assert calls == 1
+
+            await agent.run({**state, "trip_summary": {"budget_level": "budget"}})
+            assert calls == 2
+
+            key = ("jaipur", "india", 2, "luxury")
+            fetched_at, entry = research._RESEARCH_CACHE._entries[key]
+            research._RESEARCH_CACHE._entries[key] = (fetched_at - RESEARCH_CACHE_TTL_SECONDS, entry)
+            await agent.run(state)
+            assert calls == 3
+
+        assert second == third
+        assert third["hotels"] == [{"name": "Rambagh Palace", "photo_urls": []}]
+        assert research._RESEARCH_CACHE._locks == {}
+
+    async def test_failed_research_not_cached(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        state = {"city_allocations": [{"city": "Jaipur", "country": "India", "days": 1}]}
+
+        with _places_tools():
+            await agent.run(state)
+
+        assert len(research._RESEARCH_CACHE) == 0
+
+
+class TestEnrichWithPlacesData:
+    """Tests for ResearchAgent._enrich_with_places_data."""
+
+    def test_match_order(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        names = ["Amber Fort", "Palace of the Winds", "Fort Amber", "City Palace Museum"]
+        result = ResearchOutput(
+            city="Jaipur",
+            attractions_found=[
+                Attraction(name=n, city="Jaipur", category="landmark", estimated_duration_hours=2)
+                for n in names
+            ],
+        )
+        places = [
+            {"name": "Amber Fort", "rating": 4.6},
+            {"name": "Hawa Mahal", "rating": 4.4},
+            {"name": "City Palace", "rating": 4.5, "review_highlights": [{"text": "Grand"}]},
+        ]
+
+        enriched = agent._enrich_with_places_data(result, places)
+
+        assert [a.rating for a in enriched.attractions_found] == [4.6, None, 4.6, 4.5]
+        assert enriched.attractions_found[3].review_highlights == ["Grand"]
+
+    def test_punctuation_and_case_ignored(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        result = ResearchOutput(
+            city="Jaipur",
+            attractions_found=[
+                Attraction(
+                    name="JAL-MAHAL (Water Palace)",
+                    city="Jaipur",
+                    category="palace",
+                    estimated_duration_hours=1,
+                )
+            ],
+        )
+
+        enriched = agent._enrich_with_places_data(
+            result, [{"name": "Jal Mahal: Water Palace", "rating": 4.3}, {"name": None}]
+        )
+
+        assert enriched.attractions_found[0].rating == 4.3
+        assert research._normalize_name("  Jal-Mahal (Water  Palace) ") == "jal mahal water palace"
+
+
+class TestFallbacks:
+    """Tests for the LLM fallbacks used when Places API is unavailable."""
+
+    async def test_fallback_attractions(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = FallbackAttractionList(
+            attractions=[
+                FallbackAttraction(
+                    name="Amber Fort",
+                    description="Hilltop fort",
+                    category="fort",
+                    entrance_fee_usd=0,
+                ),
+                FallbackAttraction(
+                    name="Albert Hall",
+                    description="Museum",
+                    category="museum",
+                    entrance_fee_usd=4,
+                    rating=4.4,
+                ),
+            ]
+        )
+        agent = ResearchAgent(llm=mock_structured_llm)
+
+        attractions = await agent._generate_fallback_attractions("Jaipur", "India", 1)
+
+        assert [(a.city, a.entrance_fee_usd, a.rating) for a in attractions] == [
+            ("Jaipur", None, 4.2),
+            ("Jaipur", 4.0, 4.4),
+        ]
+        mock_structured_llm.with_structured_output.assert_any_call(FallbackAttractionList)
+
+    async def test_fallback_hotels(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = FallbackHotelList(
+            hotels=[FallbackHotel(name="Rambagh Palace", price_level="luxury")]
+        )
+        agent = ResearchAgent(llm=mock_structured_llm)
+
+        hotels = await agent._generate_fallback_hotels("Jaipur", "India", "luxury")
+
+        assert hotels == [
+            {
+                "name": "Rambagh Palace",
+                "city": "Jaipur",
+                "address": "",
+                "rating": 4.0,
+                "review_count": 500,
+                "price_level": "luxury",
+                "source": "llm_fallback",
+                "review_highlights": [],
+            }
+        ]
+
+    async def test_fallback_failure_returns_empty(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.side_effect = RuntimeError("rate limited")
+        agent = ResearchAgent(llm=mock_structured_llm)
+
+        assert await agent._generate_fallback_attractions("Jaipur", "India", 1) == []
+        assert await agent._generate_fallback_hotels("Jaipur", "India") == []
+
+
+class TestStructureAttractions:
+    """Tests for the LLM structuring prompt."""
+
+    async def test_prompt_built_from_places_section(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = ResearchOutput(city="Jaipur", attractions_found=[])
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [{"name": "Amber Fort", "rating": 4.6, "category": "landmark"}]
+
+        await agent._structure_attractions("Jaipur", "India", places, 1)
+
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+        assert "The traveler will spend 1 days in Jaipur." in prompt
+        assert "- Amber Fort ★4.6" in prompt
+        assert '"name"' not in prompt
+
+
+class TestBuildPlacesSection:
+    """Tests for the Places API prompt section."""
+
+    def test_format(self, mock_structured_llm):
+        agent = ResearchAgent(llm=mock_structured_llm)
+        places = [
+            {
+                "name": "Amber Fort",
+                "rating": 4.6,
+                "review_count": 98765,
+                "category": "landmark",
+                "address": "Devisinghpura, Amer",
+                "opening_hours": ["Monday: 8 AM - 5:30 PM"],
+                "website": "https://amberfort.example",
+                "photo_urls": ["a", "b"],
+                "review_highlights": [{"text": "Go early to beat the crowds"}],
+            },
+            {"name": "Jal Mahal", "opening_hours": "Always open", "review_highlights": ["Lovely"]},
+        ]
+
+        section = agent._build_places_section(places)
+
+        assert section == (
+            "\n\nDETAILED DATA FROM GOOGLE PLACES API (use this as primary source):\n"
+            "\n- Amber Fort ★4.6 (98,765 reviews)"
+            "\n  Category: landmark"
+            "\n  Address: Devisinghpura, Amer"
+            "\n  Hours: Monday: 8 AM - 5:30 PM..."
+            "\n  Website: https://amberfort.example"
+            "\n  Photos available: 2 images"
+            '\n  Review: "Go early to beat the crowds..."'
+            "\n- Jal Mahal"
+            "\n  Category: unknown"
+            '\n  Review: "Lovely..."'
+        )
+        assert agent._build_places_section(None) == ""
@@ -0,0 +1,70 @@
+"""Unit tests for the Transport/Budget agent."""
+
+from src.agents.transport_budget import TransportBudgetAgent
+from src.models.agent_outputs import BudgetBreakdown, TransportBudgetOutput
+
+
+def _empty_output() -> TransportBudgetOutput:
+    return TransportBudgetOutput(
+        inter_city_options=[],
+        local_transport_recommendations=[],
+        budget_breakdown=BudgetBreakdown(
+            transport_inter_city=40,
+            transport_local=20,
+            accommodation=300,
+            food=100,
+            activities_entrance_fees=50,
+            miscellaneous=50,
+            total=560,
+        ),
+    )
+
+
+class TestTransportBudgetRun:
+    """Tests for TransportBudgetAgent.run."""
+
+    async def test_prompt_numbering_follows_origin(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = _empty_output()
+        agent = TransportBudgetAgent(llm=mock_structured_llm)
+        state = {
+            "city_allocations": [
+                {"city": "Jaipur", "country": "India", "days": 2, "visit_order": 1},
+            ],
+            "trip_summary": {"total_days": 2},
+        }
+
+        update = await agent.run(state)
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+
+        assert update["budget_breakdown"]["total"] == 560
+        assert "Please provide:\n1. Detailed transport options" in prompt
+        assert "4. Money-saving tips" in prompt
+        assert "ORIGIN TO DESTINATION" not in prompt
+        assert "0 attractions planned" in prompt
+
+        await agent.run({**state, "origin_city": "Mumbai"})
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+
+        assert "- Origin city: Mumbai" in prompt
+        assert "- First destination: Jaipur, India" in prompt
+        assert "1. Origin-to-first-city transport options" in prompt
+        assert "5. Money-saving tips" in prompt
+
+    async def test_attractions_counted_per_city(self, mock_structured_llm):
+        mock_structured_llm.ainvoke.return_value = _empty_output()
+        agent = TransportBudgetAgent(llm=mock_structured_llm)
+
+        await agent.run({
+            "city_allocations": [
+                {"city": "Udaipur", "country": "India", "days": 2, "visit_order": 1},
+                {"city": "Jaipur", "country": "India", "days": 1, "visit_order": 2},
+            ],
+            "attractions": [
+                {"city": "Udaipur", "name": "City Palace"},
+                {"city": "Jaipur", "name": "Amber Fort"},
+                {"city": "Udaipur", "name": "Lake Pichola"},
+            ],
+        })
+        prompt = mock_structured_llm.ainvoke.await_args.args[0][1].content
+
+        assert "3 attractions planned (Udaipur: 2, Jaipur: 1)" in prompt
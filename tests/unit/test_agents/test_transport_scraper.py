@@ -0,0 +1,51 @@
+"""Unit tests for the Transport Scraper agent."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from src.agents.transport_scraper import TransportScraperAgent
+from src.config.constants import TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS
+
+
+class TestTransportScraperRun:
+    """Tests for TransportScraperAgent.run."""
+
+    async def test_requests_run_with_bounded_concurrency(self):
+        agent = TransportScraperAgent()
+        in_flight = 0
+        peak = 0
+
+        async def fake_invoke(kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return '{"error": "blocked"}'
+
+        scraper = MagicMock()
+        scraper.ainvoke.side_effect = fake_invoke
+        station_finder = MagicMock()
+        station_finder.ainvoke.side_effect = fake_invoke
+
+        cities = [f"City {i}" for i in range(TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS + 3)]
+        state = {
+            "route_segments": [
+                {"from_city": a, "to_city": b, "recommended_transport": "train"}
+                for a, b in zip(cities, cities[1:])
+            ],
+            "city_allocations": [
+                {"city": city, "country": "India", "days": 1, "visit_order": i}
+                for i, city in enumerate(cities, start=1)
+            ],
+        }
+
+        with patch.object(agent, "_select_scrapers", return_value=[("rome2rio", scraper, {})]), \
+             patch("src.agents.transport_scraper.find_nearest_stations", station_finder):
+            update = await agent.run(state)
+
+        assert scraper.ainvoke.call_count == len(cities) - 1
+        # Every segment failed, so each city gets a station lookup
+        assert station_finder.ainvoke.call_count == len(cities)
+        assert peak == TRANSPORT_SCRAPER_MAX_CONCURRENT_REQUESTS
+        assert update["scraped_transport_prices"] == []
@@ -0,0 +1,58 @@
+"""Unit tests for the in-process memory cache."""
+
+import asyncio
+
+from src.cache.memory_cache import MemoryCache
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache."""
+
+    def test_values_are_copied(self):
+        cache = MemoryCache(max_size=2)
+        value = {"hotels": [{"name": "Rambagh Palace"}]}
+
+        cache.set("jaipur", value)
+        value["hotels"].append({"name": "mutated"})
+        cache.get("jaipur")["hotels"].clear()
+
+        assert cache.get("jaipur") == {"hotels": [{"name": "Rambagh Palace"}]}
+
+    def test_least_recently_used_evicted(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expired_entries_dropped(self):
+        cache = MemoryCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        stored_at, value = cache._entries["a"]
+        cache._entries["a"] = (stored_at - 60, value)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    async def test_lock_serializes_and_cleans_up(self):
+        cache = MemoryCache(max_size=2)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            async with cache.lock("a"):
+                cached = cache.get("a")
+                if cached is not None:
+                    return cached
+                calls += 1
+                await asyncio.sleep(0.01)
+                cache.set("a", 1)
+                return 1
+
+        assert await asyncio.gather(compute(), compute()) == [1, 1]
+        assert calls == 1
+        assert cache._locks == {}
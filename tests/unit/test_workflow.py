@@ -0,0 +1,89 @@
+"""Unit tests for the travel planner graph wiring."""
+
+import asyncio
+from unittest.mock import patch
+
+from src.graph import workflow
+
+
+def _stub(name, log, delay=0.0, update=None):
+    async def node(state):
+        log.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        log.append(f"{name}:end")
+        return update or {}
+
+    return node
+
+
+def _stub_nodes(log, **overrides):
+    """Stub every graph node, recording start/end order in log."""
+    nodes = {
+        "clarification_node": _stub(
+            "clarification", log, update={"clarification_needed": False}
+        ),
+        "planner_node": _stub("planner", log),
+        "geography_node": _stub("geography", log),
+        "research_node": _stub("research", log),
+        "food_culture_node": _stub("food_culture", log),
+        "transport_scraper_node": _stub("transport_scraper", log),
+        "transport_budget_node": _stub("transport_budget", log),
+        "critic_node": _stub("critic", log, update={"validation_result": {"is_valid": True}}),
+        "finalize_node": _stub("finalize", log),
+    }
+    nodes.update(overrides)
+    return patch.multiple(workflow, **nodes)
+
+
+async def _run_graph():
+    graph = workflow.create_travel_graph()
+    await graph.ainvoke(
+        {"user_request": "Plan a trip", "iteration_count": 0},
+        {"configurable": {"thread_id": "test"}},
+    )
+
+
+class TestTravelGraph:
+    """Tests for create_travel_graph."""
+
+    async def test_food_culture_runs_alongside_geography(self):
+        log: list[str] = []
+
+        with _stub_nodes(
+            log,
+            geography_node=_stub("geography", log, delay=0.02),
+            food_culture_node=_stub("food_culture", log, delay=0.01),
+        ):
+            await _run_graph()
+
+        assert log.index("food_culture:start") < log.index("geography:end")
+        assert log.index("critic:start") > log.index("research:end")
+        assert log.index("critic:start") > log.index("food_culture:end")
+        assert log.count("critic:start") == 1
+        assert log[-1] == "finalize:end"
+
+    async def test_transport_runs_alongside_research(self):
+        log: list[str] = []
+
+        with _stub_nodes(log, research_node=_stub("research", log, delay=0.02)):
+            await _run_graph()
+
+        assert log.index("transport_scraper:start") > log.index("geography:end")
+        assert log.index("transport_scraper:start") < log.index("research:end")
+        assert log.index("critic:start") > log.index("transport_budget:end")
+        assert log.count("transport_budget:start") == 1
+
+    async def test_replan_rejoins_branches(self):
+        log: list[str] = []
+        verdicts = iter([{"requires_replanning": True}, {"is_valid": True}])
+
+        async def critic(state):
+            log.append("critic:start")
+            return {"validation_result": next(verdicts)}
+
+        with _stub_nodes(log, critic_node=critic):
+            await _run_graph()
+
+        assert log.count("food_culture:start") == 2
+        assert log.count("transport_budget:start") == 2
+        assert log.count("critic:start") == 2